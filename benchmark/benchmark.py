@@ -1,4 +1,5 @@
 import asyncio
+import csv
 import queue
 import threading
 import time
@@ -6,7 +7,6 @@ from io import BytesIO
 
 import aiohttp
 import httpx
-import pandas as pd
 import pycurl
 import requests
 import tls_client
@@ -23,11 +23,16 @@ results = []
 class FakePycurlSession:
     def __init__(self):
         self.c = pycurl.Curl()
+        self.url = None
+        self.buffer = BytesIO()
+        self.c.setopt(pycurl.WRITEDATA, self.buffer)
 
     def get(self, url):
-        buffer = BytesIO()
-        self.c.setopt(pycurl.URL, url)
-        self.c.setopt(pycurl.WRITEDATA, buffer)
+        self.buffer.seek(0)
+        self.buffer.truncate(0)
+        if url != self.url:
+            self.c.setopt(pycurl.URL, url)
+            self.url = url
         self.c.perform()
 
     def __del__(self):
@@ -37,17 +42,32 @@ class FakePycurlSession:
 class FakeCurlCffiSession:
     def __init__(self):
         self.c = curl_cffi.Curl()
+        self.url = None
+        self.buffer = bytearray()
 
     def get(self, url):
-        buffer = BytesIO()
-        self.c.setopt(curl_cffi.CurlOpt.URL, url)
-        self.c.setopt(curl_cffi.CurlOpt.WRITEDATA, buffer)
+        self.buffer.clear()
+        # the write handle is released after each perform, so it is set every time
+        options = [(curl_cffi.CurlOpt.WRITEDATA, self.buffer)]
+        if url != self.url:
+            options.append((curl_cffi.CurlOpt.URL, url))
+            self.url = url
+        self.c.setopt_batch(options)
         self.c.perform()
 
     def __del__(self):
         self.c.close()
 
 
+def write_results(filename, results):
+    with open(filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "size", "duration"])
+        writer.writerows(
+            (r["name"], r["size"], f"{r['duration']:.4f}") for r in results
+        )
+
+
 for size in ["1k", "20k", "200k"]:
     stats = {}
     url = "http://localhost:8000/" + size
@@ -70,36 +90,27 @@ for size in ["1k", "20k", "200k"]:
 
     print(f"One worker, {size}: {stats}")
 
-df = pd.DataFrame(results)
-df.to_csv("single_worker.csv", index=False, float_format="%.4f")
+write_results("single_worker.csv", results)
 
 results = []
 
 
-def worker(q, done, SessionClass):
+def worker(q, SessionClass):
     s = SessionClass()
-    while not done.is_set():
-        try:
-            url = q.get_nowait()
-        except Exception:
-            continue
+    # a None sentinel is enqueued for each worker after the urls
+    while (url := q.get()) is not None:
         s.get(url)
-        q.task_done()
 
 
-async def aiohttp_worker(q, done, s):
-    while not done.is_set():
-        url = await q.get()
+async def aiohttp_worker(urls, s):
+    for url in urls:
         async with s.get(url) as response:
             await response.read()
-        q.task_done()
 
 
-async def httpx_worker(q, done, s):
-    while not done.is_set():
-        url = await q.get()
+async def httpx_worker(urls, s):
+    for url in urls:
         await s.get(url)
-        q.task_done()
 
 
 for size in ["1k", "20k", "200k"]:
@@ -113,23 +124,22 @@ for size in ["1k", "20k", "200k"]:
         ("curl_cffi_raw", FakeCurlCffiSession),
         ("pycurl", FakePycurlSession),
     ]:
-        q = queue.Queue()
+        q = queue.SimpleQueue()
         for _ in range(1000):
             q.put(url)
-        done = threading.Event()
+        for _ in range(10):
+            q.put(None)
         start = time.time()
         threads = []
         for _ in range(10):
-            t = threading.Thread(target=worker, args=(q, done, SessionClass))
+            t = threading.Thread(target=worker, args=(q, SessionClass))
             threads.append(t)
             t.start()
-        q.join()
-        done.set()
+        for t in threads:
+            t.join()
         dur = time.time() - start
         stats[name] = dur
         results.append({"name": name, "size": size, "duration": dur})
-        for t in threads:
-            t.join()
     # print(stats)
 
     async def test_asyncs_workers(url, size, stats):
@@ -138,26 +148,17 @@ for size in ["1k", "20k", "200k"]:
             ("httpx_async", httpx_worker, httpx.AsyncClient),
             ("curl_cffi_async", httpx_worker, curl_cffi.requests.AsyncSession),
         ]:
-            q = asyncio.Queue()
-            for _ in range(1000):
-                await q.put(url)
-            done = asyncio.Event()
+            urls = [url] * 1000
+            # each of the 10 workers gets its own slice, no queue in between
+            batches = [urls[i::10] for i in range(10)]
             start = time.time()
-            workers = []
             async with SessionClass() as s:
-                for _ in range(10):
-                    w = asyncio.create_task(worker(q, done, s))
-                    workers.append(w)
-                await q.join()
-                done.set()
+                await asyncio.gather(*(worker(batch, s) for batch in batches))
             dur = time.time() - start
             stats[name] = dur
             results.append({"name": name, "size": size, "duration": dur})
-            for w in workers:
-                w.cancel()
 
     asyncio.run(test_asyncs_workers(url, size, stats))
     print(f"10 Workers, {size}: {stats}")
 
-df = pd.DataFrame(results)
-df.to_csv("multiple_workers.csv", index=False, float_format="%.4f")
+write_results("multiple_workers.csv", results)
@@ -4,14 +4,27 @@ Websocket client simple benchmark - TLS (WSS)
 """
 
 import time
-from asyncio import AbstractEventLoop, CancelledError, Task, TaskGroup, get_running_loop
-from asyncio import run as run_async
+from asyncio import AbstractEventLoop, CancelledError, Task, get_running_loop
 from asyncio import sleep
 
 from typing_extensions import Never
-from ws_bench_utils import BenchmarkDirection, binary_data_generator, config, logger
-
-from curl_cffi import AsyncSession, AsyncWebSocket, Response, WebSocketClosed
+from ws_bench_utils import (
+    BenchmarkDirection,
+    binary_data_generator,
+    config,
+    logger,
+    run_concurrently,
+    run_loop,
+    tune_process,
+)
+
+from curl_cffi import (
+    AsyncSession,
+    AsyncWebSocket,
+    CurlWsFlag,
+    Response,
+    WebSocketClosed,
+)
 
 
 def calculate_stats(start_time: float, total_len: int) -> tuple[float, float]:
@@ -60,20 +73,21 @@ async def ws_counter(ws: AsyncWebSocket) -> None:
     Args:
         ws (`AsyncWebSocket`): Instantiated Curl CFFI AsyncWebSocket object.
     """
-    recvd_len: int = 0
     expected_bytes: int = config.total_bytes
     start_time: float = time.perf_counter()
     logger.info("Receiving data from server, expecting %d GiB", config.total_gb)
     try:
-        async for msg in ws:
-            recvd_len += len(msg)
-            if recvd_len >= expected_bytes:
+        # The byte count is kept by the C glue code, messages are only drained here
+        while ws.bytes_received < expected_bytes:
+            batch: list[tuple[bytes, int]] = await ws.recv_batch()
+            if batch[-1][1] & CurlWsFlag.CLOSE:
                 break
 
     except WebSocketClosed as exc:
         logger.debug(exc)
 
     finally:
+        recvd_len: int = ws.bytes_received
         duration, avg_rate = calculate_stats(start_time, recvd_len)
         print("\r\x1b[K", end="")
         logger.info(
@@ -88,7 +102,6 @@ async def ws_sender(ws: AsyncWebSocket) -> None:
     Args:
         ws (`AsyncWebSocket`): Instantiated Curl CFFI AsyncWebSocket object.
     """
-    sent_len: int = 0
     start_time: float = time.perf_counter()
     logger.info("Sending %dGB of data to server", config.total_gb)
     try:
@@ -96,13 +109,13 @@ async def ws_sender(ws: AsyncWebSocket) -> None:
             total_gb=config.total_gb, chunk_size=config.chunk_size
         ):
             await ws.send(payload=data_chunk)
-            sent_len += len(data_chunk)
 
     except WebSocketClosed as exc:
         logger.debug(exc)
 
     finally:
         await ws.close(code=1000)
+        sent_len: int = ws.bytes_sent
         duration, avg_rate = calculate_stats(start_time, sent_len)
         print("\r\x1b[K", end="")
         logger.info("Sent: %.2f GB in %.2f seconds", sent_len / (1024**3), duration)
@@ -123,24 +136,20 @@ async def run_benchmark() -> None:
                 config.srv_path,
                 config.benchmark_direction.name,
             )
-            async with (
-                session.ws_connect(
-                    config.srv_path,
-                    recv_queue_size=config.recv_queue,
-                    send_queue_size=config.send_queue,
-                ) as ws,
-                TaskGroup() as tg,
-            ):
+            async with session.ws_connect(
+                config.srv_path,
+                recv_queue_size=config.recv_queue,
+                send_queue_size=config.send_queue,
+            ) as ws:
                 match config.benchmark_direction:
                     case BenchmarkDirection.READ_ONLY:
-                        _ = tg.create_task(ws_counter(ws))
+                        await run_concurrently(ws_counter(ws))
 
                     case BenchmarkDirection.SEND_ONLY:
-                        _ = tg.create_task(ws_sender(ws))
+                        await run_concurrently(ws_sender(ws))
 
                     case BenchmarkDirection.CONCURRENT:
-                        _ = tg.create_task(ws_counter(ws))
-                        _ = tg.create_task(ws_sender(ws))
+                        await run_concurrently(ws_counter(ws), ws_sender(ws))
 
     except Exception:
         logger.exception("curl-cffi benchmark failed")
@@ -166,10 +175,5 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    try:
-        # pylint: disable-next=import-outside-toplevel
-        import uvloop
-
-        uvloop.run(main())
-    except ImportError:
-        run_async(main())
+    tune_process()
+    run_loop(main())
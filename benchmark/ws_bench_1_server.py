@@ -3,17 +3,37 @@
 Websocket server example - TLS (WSS)
 """
 
-from asyncio import TaskGroup
+import asyncio
+from argparse import ArgumentParser, Namespace
+from contextlib import suppress
+from typing import cast
 
 from aiohttp import web
+from picows import (
+    WSCloseCode,
+    WSFrame,
+    WSListener,
+    WSMsgType,
+    WSTransport,
+    WSUpgradeRequest,
+    ws_create_server,
+)
 from ws_bench_utils import (
     BenchmarkDirection,
     binary_data_generator,
     config,
-    get_loop,
+    fork_workers,
     logger,
+    new_event_loop,
+    run_concurrently,
+    run_loop,
+    tune_process,
 )
 
+# aiohttp message types, bound once for the receive loop
+_WS_BINARY: web.WSMsgType = web.WSMsgType.BINARY
+_WS_ERROR: web.WSMsgType = web.WSMsgType.ERROR
+
 
 async def recv(ws: web.WebSocketResponse) -> None:
     """Just receive the data in a tight loop. Do nothing else.
@@ -22,22 +42,23 @@ async def recv(ws: web.WebSocketResponse) -> None:
         ws (web.WebSocketResponse): The WebSocket server object.
     """
     async for msg in ws:
-        if msg.type == web.WSMsgType.BINARY:
+        if msg.type is _WS_BINARY:
             continue
 
-        if msg.type == web.WSMsgType.ERROR:
+        if msg.type is _WS_ERROR:
             break
 
 
 async def send(ws: web.WebSocketResponse) -> None:
-    """Send the generated chunks until total size is hit.
+    """Send the generated chunks until total size is hit. Chunks are generated
+    at the frame size, so each frame needs a single ``send_bytes`` call.
 
     Args:
         ws (web.WebSocketResponse): The WebSocket server object.
     """
     try:
         async for binary_data in binary_data_generator(
-            config.total_gb, config.chunk_size
+            config.total_gb, config.ws_frame_size
         ):
             await ws.send_bytes(binary_data)
     except ConnectionError as exc:
@@ -53,23 +74,24 @@ async def ws_handler(request: web.Request) -> web.WebSocketResponse:
     Returns:
         web.WebSocketResponse: Response object
     """
-    ws: web.WebSocketResponse = web.WebSocketResponse()
+    # Only wait for the transport to drain after writer_limit bytes, not every frame
+    ws: web.WebSocketResponse = web.WebSocketResponse(
+        writer_limit=config.server_writer_limit
+    )
     _ = await ws.prepare(request)
     logger.info("Secure client connected.")
 
     try:
-        async with TaskGroup() as tg:
-            # This is server side so everything is reversed
-            match config.benchmark_direction:
-                case BenchmarkDirection.READ_ONLY:
-                    _ = tg.create_task(send(ws))
+        # This is server side so everything is reversed
+        match config.benchmark_direction:
+            case BenchmarkDirection.READ_ONLY:
+                await run_concurrently(send(ws))
 
-                case BenchmarkDirection.SEND_ONLY:
-                    _ = tg.create_task(recv(ws))
+            case BenchmarkDirection.SEND_ONLY:
+                await run_concurrently(recv(ws))
 
-                case BenchmarkDirection.CONCURRENT:
-                    _ = tg.create_task(send(ws))
-                    _ = tg.create_task(recv(ws))
+            case BenchmarkDirection.CONCURRENT:
+                await run_concurrently(send(ws), recv(ws))
 
     # pylint: disable-next=broad-exception-caught
     except Exception:
@@ -79,20 +101,135 @@ async def ws_handler(request: web.Request) -> web.WebSocketResponse:
     return ws
 
 
+# Largest WebSocket frame header, picows needs this much space before the payload
+_PICOWS_HEADER_ROOM: int = 14
+
+
+class PicowsBenchListener(WSListener):
+    """The same server actions as ``ws_handler``, using picows. Framing is done in
+    Cython, so the server is much less likely to be the bottleneck of the benchmark.
+    """
+
+    def __init__(self) -> None:
+        self._transport: WSTransport | None = None
+        self._send_task: asyncio.Task[None] | None = None
+        self._can_write: asyncio.Event = asyncio.Event()
+        self._can_write.set()
+
+    def on_ws_connected(self, transport: WSTransport) -> None:
+        logger.info("Secure client connected.")
+        self._transport = transport
+        # This is server side so everything is reversed, received frames are
+        # dropped in on_ws_frame
+        if config.benchmark_direction is not BenchmarkDirection.SEND_ONLY:
+            self._send_task = asyncio.create_task(self.send())
+
+    def on_ws_frame(self, transport: WSTransport, frame: WSFrame) -> None:
+        if frame.msg_type == WSMsgType.CLOSE:
+            transport.send_close(frame.get_close_code(), frame.get_close_message())
+            transport.disconnect()
+
+    def on_ws_disconnected(self, transport: WSTransport) -> None:
+        if self._send_task is not None:
+            _ = self._send_task.cancel()
+        logger.info("Client disconnected.")
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    async def send(self) -> None:
+        """Send the generated chunks until total size is hit, waiting whenever the
+        transport buffer is over its high watermark.
+
+        The generator reuses one chunk for all full-sized frames, so that chunk is
+        copied once into a buffer with room for the frame header in front of it.
+        picows writes the header in place, and the payload is never copied again.
+        """
+        assert self._transport is not None
+        transport: WSTransport = self._transport
+        can_write: asyncio.Event = self._can_write
+        frame_size: int = config.ws_frame_size
+        frame_buffer: bytearray | None = None
+        async for binary_data in binary_data_generator(config.total_gb, frame_size):
+            if not can_write.is_set():
+                _ = await can_write.wait()
+            if len(binary_data) == frame_size:
+                if frame_buffer is None:
+                    frame_buffer = bytearray(_PICOWS_HEADER_ROOM) + binary_data
+                transport.send_reuse_external_bytearray(
+                    WSMsgType.BINARY, frame_buffer, _PICOWS_HEADER_ROOM
+                )
+            else:
+                transport.send(WSMsgType.BINARY, binary_data)
+
+        if config.benchmark_direction is BenchmarkDirection.READ_ONLY:
+            transport.send_close(WSCloseCode.OK)
+
+
+async def run_picows_server(reuse_port: bool = False) -> None:
+    """Start the picows server and serve until cancelled.
+
+    Args:
+        reuse_port (bool): Bind the port with ``SO_REUSEPORT``, for multiple workers.
+    """
+
+    def listener_factory(_: WSUpgradeRequest) -> PicowsBenchListener:
+        return PicowsBenchListener()
+
+    server: asyncio.Server = await ws_create_server(
+        listener_factory,
+        config.srv_host.exploded,
+        config.srv_port,
+        ssl=config.ssl_ctx,
+        max_frame_size=config.server_max_msg,
+        reuse_port=reuse_port,
+    )
+    async with server:
+        await server.serve_forever()
+
+
 def main() -> None:
     """Entrypoint"""
+    parser: ArgumentParser = ArgumentParser(description="WebSocket Benchmark Server")
+    _ = parser.add_argument(
+        "--server",
+        choices=["picows", "aiohttp"],
+        default="picows",
+        help="WebSocket server implementation",
+        type=str,
+    )
+    _ = parser.add_argument(
+        "-w",
+        "--workers",
+        default=1,
+        help="Number of server processes sharing the port with SO_REUSEPORT",
+        type=int,
+    )
+    args: Namespace = parser.parse_args()
+    logger.info("Starting %s server on %s", args.server, config.srv_path)
+    reuse_port: bool = fork_workers(cast(int, args.workers))
+    tune_process()
+
+    if cast(str, args.server) == "picows":
+        with suppress(KeyboardInterrupt):
+            run_loop(run_picows_server(reuse_port))
+        return
 
     # Create and start the aiohttp server
     app: web.Application = web.Application()
     _ = app.add_routes(routes=[web.get("/ws", ws_handler)])
-    logger.info("Starting server on %s", config.srv_path)
     web.run_app(
         app,
         host=config.srv_host.exploded,
         port=config.srv_port,
-        loop=get_loop(),
+        loop=new_event_loop(),
         ssl_context=config.ssl_ctx,
-        access_log=logger,
+        reuse_port=reuse_port,
+        # Connections are logged by the handlers, no access log line to format
+        access_log=None,
         print=logger.debug,
     )
 
@@ -1,33 +1,318 @@
 #!/usr/bin/env python3
 """
-WebSocket benchmark with SHA256 verification.
+WebSocket benchmark with SHA256 (or BLAKE3) verification.
 """
 
 import asyncio
 import hashlib
 import mmap
+import os
+import struct
 import time
 from argparse import ArgumentParser, Namespace
+from collections import deque
 from collections.abc import AsyncGenerator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
 from secrets import compare_digest
-from typing import cast
+from typing import Any, cast
 
 from aiohttp import web
-from ws_bench_utils import config, generate_random_chunks, get_loop, logger
-
-from curl_cffi import AsyncSession, AsyncWebSocket, Response
-
-
-def compare_hash(source_hash: str, received_hash: str) -> None:
-    """Compare two hashes and log a message"""
+from ws_bench_utils import (
+    config,
+    fork_workers,
+    generate_random_chunks,
+    logger,
+    new_event_loop,
+    run_loop,
+    tune_process,
+)
+
+from curl_cffi import (
+    AsyncSession,
+    AsyncWebSocket,
+    CurlWsFlag,
+    Response,
+    WebSocketClosed,
+)
+
+# Not exported by every Python version, EINVAL on Linux kernels before 5.14
+_MADV_POPULATE_READ: int | None = getattr(mmap, "MADV_POPULATE_READ", None)
+
+# Segment size of the SHA-256 tree hash, the file is generated in these segments
+_TREE_SEGMENT_SIZE: int = 64 * 1024**2
+
+# Message types checked for every received message
+_WS_BINARY: web.WSMsgType = web.WSMsgType.BINARY
+_WS_ERROR: web.WSMsgType = web.WSMsgType.ERROR
+
+
+def compare_hash(source_hash: bytes, received_hash: bytes) -> None:
+    """Compare two raw digests and log a message, hex is only used for logging"""
     if compare_digest(source_hash, received_hash):
         logger.info("✅ Hash Verification SUCCESSFUL")
         return
 
-    logger.warning("Received data hash: %s", received_hash)
+    logger.warning("Received data hash: %s", received_hash.hex())
     logger.warning("❌ Hash Verification FAILED")
 
 
+def new_hash() -> Any:
+    """Create a hash object for the algorithm selected in ``config.hash_name``.
+    BLAKE3 requires the ``blake3`` package, it and the SHA-256 tree hash use all
+    cores.
+
+    Returns:
+        Any: A ``hashlib``, ``TreeHash`` or ``blake3`` hash object.
+    """
+    if config.hash_name == "blake3":
+        # pylint: disable-next=import-outside-toplevel
+        from blake3 import blake3
+
+        return blake3(max_threads=blake3.AUTO)
+    if config.hash_name == "sha256-tree":
+        return TreeHash()
+    return hashlib.new(config.hash_name)
+
+
+def get_hash_filename() -> Path:
+    """Get the hash file for the selected algorithm, SHA256 keeps the original name.
+
+    Returns:
+        Path: Path of the hash file.
+    """
+    if config.hash_name == "sha256":
+        return config.hash_filename
+    return config.hash_filename.with_suffix(f".{config.hash_name}")
+
+
+class TreeHash:
+    """SHA-256 tree hash, to verify on all cores without the ``blake3`` package.
+
+    The data is split into ``segment_size`` segments which are hashed in parallel,
+    the digest is the SHA-256 of the concatenated segment digests. It only matches
+    hashes created with the same segment size.
+    """
+
+    def __init__(self, segment_size: int = _TREE_SEGMENT_SIZE) -> None:
+        self._segment_size: int = segment_size
+        self._workers: int = os.cpu_count() or 1
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(self._workers)
+        self._segment: list[memoryview] = []
+        self._segment_len: int = 0
+        self._digests: list[Future[bytes]] = []
+
+    @staticmethod
+    def _digest(pieces: list[memoryview]) -> bytes:
+        hash_object = hashlib.sha256()
+        for piece in pieces:
+            hash_object.update(piece)
+        return hash_object.digest()
+
+    def _submit(self) -> None:
+        # Hold at most one segment per worker in memory
+        if len(self._digests) >= self._workers:
+            _ = self._digests[-self._workers].result()
+        self._digests.append(self._executor.submit(self._digest, self._segment))
+        self._segment, self._segment_len = [], 0
+
+    def update(self, data: bytes | memoryview) -> None:
+        """Add data, splitting it at the segment boundaries."""
+        view: memoryview = memoryview(data)
+        while view:
+            size: int = min(len(view), self._segment_size - self._segment_len)
+            self._segment.append(view[:size])
+            self._segment_len += size
+            view = view[size:]
+            if self._segment_len == self._segment_size:
+                self._submit()
+
+    def digest(self) -> bytes:
+        """Hash the last segment and return the digest of all segment digests."""
+        if self._segment_len:
+            self._submit()
+        digests: list[bytes] = [digest.result() for digest in self._digests]
+        self._executor.shutdown()
+        return hashlib.sha256(b"".join(digests)).digest()
+
+    def hexdigest(self) -> str:
+        """Same as ``digest``, as a hex string."""
+        return self.digest().hex()
+
+
+class BackgroundHasher:
+    """Feed data to a hash object from a worker thread, in batches.
+
+    Both ``hashlib`` and ``blake3`` release the GIL while hashing large buffers, so
+    the event loop keeps receiving while the previous batch is being hashed.
+    """
+
+    def __init__(self, hash_object: Any, batch_size: int = 16 * 1024**2) -> None:
+        self._hash_object: Any = hash_object
+        self._batch_size: int = batch_size
+        self._batch: list[bytes] = []
+        self._batch_len: int = 0
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._pending: asyncio.Future[None] | None = None
+
+    def _update_all(self, batch: list[bytes]) -> None:
+        for data in batch:
+            self._hash_object.update(data)
+
+    async def _submit(self) -> None:
+        # Only one batch is hashed while the next one is collected
+        if self._pending is not None:
+            await self._pending
+        batch, self._batch, self._batch_len = self._batch, [], 0
+        self._pending = asyncio.get_running_loop().run_in_executor(
+            self._executor, self._update_all, batch
+        )
+
+    async def update(self, data: bytes) -> None:
+        """Add data to the current batch, hand it off when the batch is full."""
+        self._batch.append(data)
+        self._batch_len += len(data)
+        if self._batch_len >= self._batch_size:
+            await self._submit()
+
+    async def digest(self) -> bytes:
+        """Hash the remaining data and return the digest."""
+        await self._submit()
+        if self._pending is not None:
+            await self._pending
+        self._executor.shutdown()
+        return self._hash_object.digest()
+
+
+def generate_segments(filename: Path, offset: int, size: int) -> list[bytes]:
+    """Fill ``size`` bytes of the test file from ``offset``, in a worker process.
+
+    Args:
+        filename (Path): The pre-allocated test file.
+        offset (int): Start of the range, a multiple of the tree hash segment size.
+        size (int): Size of the range.
+
+    Returns:
+        list[bytes]: SHA-256 digests of the tree hash segments in the range.
+    """
+    digests: list[bytes] = []
+    hash_object = hashlib.sha256()
+    segment_len: int = 0
+    with (
+        filename.open("r+b") as fpath,
+        mmap.mmap(fpath.fileno(), size, access=mmap.ACCESS_WRITE, offset=offset) as mm,
+    ):
+        for chunk in generate_random_chunks(size, offset):
+            _ = mm.write(chunk)
+            # Split the chunk at the segment boundaries, like TreeHash.update
+            view: memoryview = chunk
+            while view:
+                hash_size: int = min(len(view), _TREE_SEGMENT_SIZE - segment_len)
+                hash_object.update(view[:hash_size])
+                segment_len += hash_size
+                view = view[hash_size:]
+                if segment_len == _TREE_SEGMENT_SIZE:
+                    digests.append(hash_object.digest())
+                    hash_object, segment_len = hashlib.sha256(), 0
+
+        mm.flush()
+
+    if segment_len:
+        digests.append(hash_object.digest())
+    return digests
+
+
+def generate_tree_hashed() -> str:
+    """Generate the test file on all cores, each worker process writes and hashes
+    a contiguous range of tree hash segments.
+
+    Returns:
+        str: The tree hash of the file, as a hex string.
+    """
+    workers: int = os.cpu_count() or 1
+    segments: int = -(-config.total_bytes // _TREE_SEGMENT_SIZE)
+    range_size: int = -(-segments // workers) * _TREE_SEGMENT_SIZE
+    logger.info("Writing data on %d processes", workers)
+    with ProcessPoolExecutor(workers) as executor:
+        ranges: list[Future[list[bytes]]] = [
+            executor.submit(
+                generate_segments,
+                config.data_filename,
+                offset,
+                min(range_size, config.total_bytes - offset),
+            )
+            for offset in range(0, config.total_bytes, range_size)
+        ]
+        digests: list[bytes] = [
+            digest for digest_range in ranges for digest in digest_range.result()
+        ]
+    return hashlib.sha256(b"".join(digests)).hexdigest()
+
+
+def generate_sequential() -> str:
+    """Generate the test file in this process, while hashing it in a thread.
+
+    Returns:
+        str: The hash of the file, as a hex string.
+    """
+    hash_object = new_hash()
+
+    # Write file to disk
+    with (
+        config.data_filename.open("r+b") as fpath,
+        mmap.mmap(fpath.fileno(), config.total_bytes, access=mmap.ACCESS_WRITE) as mm,
+    ):
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL, 0, config.total_bytes)
+
+        logger.info(
+            "Writing data in %d chunks",
+            config.total_bytes // config.large_chunk_size,
+        )
+        # mmap.write() advances the position itself, no offset bookkeeping
+        _ = mm.seek(0)
+        # The hash releases the GIL, so chunks are hashed in a worker thread
+        # while they are copied into the file. Up to 4 chunks may be queued,
+        # so that neither side waits on the other for every chunk.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending: deque[Future[None]] = deque()
+            for chunk in generate_random_chunks():
+                pending.append(executor.submit(hash_object.update, chunk))
+                _ = mm.write(chunk)
+                if len(pending) > 4:
+                    pending.popleft().result()
+            for hashed in pending:
+                hashed.result()
+
+        mm.flush()
+
+    return hash_object.hexdigest()
+
+
+def hash_existing_file() -> str:
+    """Hash the test file already on disk with the selected algorithm.
+
+    Returns:
+        str: The hash of the file, as a hex string.
+    """
+    hash_object = new_hash()
+    with (
+        config.data_filename.open("rb") as fpath,
+        mmap.mmap(fpath.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+    ):
+        if hasattr(mm, "madvise"):
+            mm.madvise(mmap.MADV_SEQUENTIAL, 0, len(mm))
+
+        with memoryview(mm) as view:
+            for offset in range(0, len(mm), config.large_chunk_size):
+                hash_object.update(view[offset : offset + config.large_chunk_size])
+            # TreeHash keeps views of the last segment until the digest is taken
+            final_hash: str = hash_object.hexdigest()
+
+    return final_hash
+
+
 def generate_files() -> None:
     """
     Generate the testing data file and its hash, save it to disk.
@@ -36,8 +321,22 @@ def generate_files() -> None:
         "Generating %d GiB test file: '%s'", config.total_gb, config.data_filename
     )
 
+    hash_filename: Path = get_hash_filename()
     if config.data_filename.is_file() and config.data_filename.stat().st_size > 0:
-        logger.info("File already exists, skipping generation")
+        if hash_filename.is_file():
+            logger.info("File already exists, skipping generation")
+            return
+
+        # Generated earlier with another --hash, only the hash file is missing
+        logger.info("File already exists, hashing it with %s", config.hash_name)
+        try:
+            final_hash: str = hash_existing_file()
+        except Exception:
+            logger.exception("Failed to hash file '%s'", config.data_filename)
+            return
+
+        _ = hash_filename.write_text(final_hash, encoding="utf-8")
+        logger.info("Hash saved to '%s': %s", hash_filename, final_hash)
         return
 
     try:
@@ -48,39 +347,19 @@ def generate_files() -> None:
             _ = fp.write(b"\0")
 
         logger.info("Disk space allocation complete")
-        hash_object = hashlib.sha256()
         start_time: float = time.perf_counter()
-
-        # Write file to disk
-        with (
-            config.data_filename.open("r+b") as fpath,
-            mmap.mmap(
-                fpath.fileno(), config.total_bytes, access=mmap.ACCESS_WRITE
-            ) as mm,
-        ):
-            offset: int = 0
-            if hasattr(mm, "madvise"):
-                mm.madvise(mmap.MADV_SEQUENTIAL, 0, config.total_bytes)
-
-            logger.info(
-                "Writing data in %d chunks",
-                config.total_bytes // config.large_chunk_size,
-            )
-            for chunk in generate_random_chunks():
-                hash_object.update(chunk)
-                chunk_len = len(chunk)
-                mm[offset : offset + chunk_len] = chunk
-                offset += chunk_len
-
-            mm.flush()
-
+        # The tree hash segments can be written and hashed independently
+        final_hash = (
+            generate_tree_hashed()
+            if config.hash_name == "sha256-tree"
+            else generate_sequential()
+        )
         end_time: float = time.perf_counter()
         elapsed_time: float = end_time - start_time
 
         # Write the hashes to file
-        final_hash: str = hash_object.hexdigest()
-        _ = config.hash_filename.write_text(final_hash, encoding="utf-8")
-        logger.info("Hash saved to '%s': %s", config.hash_filename, final_hash)
+        _ = hash_filename.write_text(final_hash, encoding="utf-8")
+        logger.info("Hash saved to '%s': %s", hash_filename, final_hash)
 
         if elapsed_time > 0:
             logger.info(
@@ -95,13 +374,13 @@ def generate_files() -> None:
         return
 
 
-async def stream_test_data() -> AsyncGenerator[bytes]:
-    """Asynchronously yield test file data in chunks using mmap.
+async def stream_test_data() -> AsyncGenerator[memoryview]:
+    """Asynchronously yield test file data in chunks using mmap. The chunks are
+    views into the mapped file, so no data is copied before it is sent.
 
     Returns:
-        AsyncGenerator[bytes]: Yields chunks of the test file.
+        AsyncGenerator[memoryview]: Yields chunks of the test file.
     """
-    drop_interval: int = 512 * 1024 * 1024  # 512 MiB
     file_size: int = config.data_filename.stat().st_size
     logger.info(
         "Streaming '%s' in %d chunks",
@@ -109,29 +388,47 @@ async def stream_test_data() -> AsyncGenerator[bytes]:
         file_size // config.large_chunk_size,
     )
 
-    with (
-        config.data_filename.open("rb") as fp,
-        mmap.mmap(fp.fileno(), file_size, access=mmap.ACCESS_READ) as mm,
-    ):
-        can_madvise: bool = hasattr(mm, "madvise")
-        if can_madvise:
-            mm.madvise(mmap.MADV_SEQUENTIAL, 0, file_size)
-        last_drop: int = 0
-        start_time: float = time.perf_counter()
-        for offset in range(0, file_size, config.large_chunk_size):
-            chunk: bytes = mm[offset : offset + config.large_chunk_size]
-            yield chunk
-            if can_madvise and offset - last_drop >= drop_interval:
-                mm.madvise(
-                    mmap.MADV_DONTNEED,
-                    last_drop,
-                    offset - last_drop,
-                )
-                last_drop = offset
-
-        end_time: float = time.perf_counter()
-        if can_madvise and last_drop < file_size:
-            mm.madvise(mmap.MADV_DONTNEED, last_drop, file_size - last_drop)
+    with config.data_filename.open("rb") as fp:
+        mm: mmap.mmap = mmap.mmap(fp.fileno(), file_size, access=mmap.ACCESS_READ)
+        view: memoryview = memoryview(mm)
+        try:
+            # The kernel reads ahead and reclaims pages behind a sequential reader
+            # by itself, dropping ranges by hand only fragments the mapping
+            can_madvise: bool = hasattr(mm, "madvise")
+            if can_madvise:
+                mm.madvise(mmap.MADV_SEQUENTIAL, 0, file_size)
+            populate: int | None = _MADV_POPULATE_READ if can_madvise else None
+            populating: Future[None] | None = None
+            window: int = config.populate_window
+            start_time: float = time.perf_counter()
+            # Leaving the block waits for the last populate, before the unmap
+            with ThreadPoolExecutor(max_workers=1) as populator:
+                for offset in range(0, file_size, config.large_chunk_size):
+                    if can_madvise and offset % window == 0:
+                        if populating is not None and populating.done():
+                            if populating.exception() is not None:
+                                populate = None
+                            populating = None
+                        # Fault each window in with a few large reads, instead of
+                        # a page fault per 4 KiB while the chunks are sent. This
+                        # runs in a thread, madvise returns only once it is done.
+                        if populate is not None:
+                            populating = populator.submit(
+                                mm.madvise, populate, offset, window
+                            )
+                        # and start reading the next one in the background
+                        if offset + window < file_size:
+                            mm.madvise(mmap.MADV_WILLNEED, offset + window, window)
+                    yield view[offset : offset + config.large_chunk_size]
+
+            end_time: float = time.perf_counter()
+
+        finally:
+            view.release()
+            # Chunks still held by a send queue keep the mapping alive, in which
+            # case it is unmapped once the last of them is released.
+            with suppress(BufferError):
+                mm.close()
 
     elapsed_time: float = end_time - start_time
     if elapsed_time > 0:
@@ -144,6 +441,94 @@ async def stream_test_data() -> AsyncGenerator[bytes]:
         )
 
 
+def ws_frame_header(length: int) -> bytes:
+    """Build the header of an unmasked, final, binary WebSocket frame.
+
+    Args:
+        length (int): Payload length in bytes.
+
+    Returns:
+        bytes: The frame header, to be sent right before the payload.
+    """
+    if length < 126:
+        return struct.pack("!BB", 0x82, length)
+    if length < 1 << 16:
+        return struct.pack("!BBH", 0x82, 126, length)
+    return struct.pack("!BBQ", 0x82, 127, length)
+
+
+def can_sendfile(transport: asyncio.BaseTransport | None) -> bool:
+    """Check if the test file can be sent with ``loop.sendfile``. This needs a plain
+    socket transport, since TLS records have to be encrypted in userspace, and the
+    standard asyncio event loop, uvloop and winloop do not implement it.
+
+    Args:
+        transport (asyncio.BaseTransport | None): Transport of the server connection.
+
+    Returns:
+        bool: ``True`` if the zero-copy path can be used.
+    """
+    return (
+        transport is not None
+        and config.ssl_ctx is None
+        and transport.get_extra_info("sslcontext") is None
+        and isinstance(asyncio.get_running_loop(), asyncio.BaseEventLoop)
+    )
+
+
+async def sendfile_test_data(transport: asyncio.WriteTransport) -> None:
+    """Send the test file as binary frames, letting the kernel copy the payloads
+    straight from the page cache to the socket. Server frames are not masked, so
+    the file bytes go on the wire unchanged after each frame header.
+
+    Args:
+        transport (asyncio.WriteTransport): Plain socket transport of the connection.
+    """
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+    file_size: int = config.data_filename.stat().st_size
+    logger.info(
+        "Sending '%s' in %d chunks with sendfile",
+        config.data_filename,
+        file_size // config.large_chunk_size,
+    )
+
+    with config.data_filename.open("rb") as fp:
+        # Like the mapping in stream_test_data, the kernel reads ahead and reclaims
+        # pages behind a sequential reader by itself
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        for offset in range(0, file_size, config.large_chunk_size):
+            count: int = min(config.large_chunk_size, file_size - offset)
+            transport.write(ws_frame_header(count))
+            _ = await loop.sendfile(transport, fp, offset, count)
+
+
+async def send_test_data(ws: AsyncWebSocket) -> None:
+    """Send the test file in ``config.stream_message_size`` messages. Disk chunks are
+    sliced for smaller messages and combined with ``send_many`` for larger ones,
+    both as views of the mapped file, so the size never adds a copy.
+
+    Args:
+        ws (AsyncWebSocket): Curl-CFFI WebSocket.
+    """
+    message_size: int = config.stream_message_size
+    if message_size < config.large_chunk_size:
+        async for chunk in stream_test_data():
+            for offset in range(0, len(chunk), message_size):
+                await ws.send_bytes(chunk[offset : offset + message_size])
+        return
+
+    batch_size: int = message_size // config.large_chunk_size
+    batch: list[memoryview] = []
+    async for chunk in stream_test_data():
+        batch.append(chunk)
+        if len(batch) == batch_size:
+            await ws.send_many(batch)
+            batch = []
+    if batch:
+        await ws.send_many(batch)
+
+
 async def recv_benchmark_handler(ws: web.WebSocketResponse | AsyncWebSocket) -> None:
     """Handle the download benchmark, either as server or a client.
 
@@ -151,71 +536,84 @@ async def recv_benchmark_handler(ws: web.WebSocketResponse | AsyncWebSocket) ->
         ws (web.WebSocketResponse | AsyncWebSocket): AIOHTTP or Curl-CFFI WebSocket.
     """
     logger.info("Connected for download benchmark")
-    if not (config.hash_filename.is_file() and config.hash_filename.stat().st_size):
-        logger.error("Hash file '%s' not found or empty", config.hash_filename)
-        return
+    source_hash: bytes = b""
+    if config.verify:
+        hash_filename: Path = get_hash_filename()
+        if not (hash_filename.is_file() and hash_filename.stat().st_size):
+            logger.error("Hash file '%s' not found or empty", hash_filename)
+            return
 
-    source_hash: str = config.hash_filename.read_text("utf-8").strip()
-    logger.info("Loaded hash for '%s': %s", config.data_filename, source_hash)
+        source_hex: str = hash_filename.read_text("utf-8").strip()
+        source_hash = bytes.fromhex(source_hex)
+        logger.info("Loaded hash for '%s': %s", config.data_filename, source_hex)
 
     try:
-        logger.info("Allocating %d GiB memory buffer", config.total_gb)
-        with mmap.mmap(-1, config.total_bytes) as testdata_buffer:
-            # Receive the data into the buffer
-            offset: int = 0
-            logger.info("Receiving data from client")
-            start_time = time.perf_counter()
-            if isinstance(ws, web.WebSocketResponse):
-                logger.info("WebSocket type: SERVER")
-                async for msg in ws:
-                    if msg.type is web.WSMsgType.ERROR:
-                        logger.error("WebSocket error: %r", ws.exception())
-                        return
-
-                    if msg.type is web.WSMsgType.BINARY:
-                        msg_len: int = len(msg.data)
-                        testdata_buffer[offset : offset + msg_len] = msg.data
-                        offset += msg_len
-            else:
-                async for msg in ws:
-                    msg_len = len(msg)
-                    testdata_buffer[offset : offset + msg_len] = msg
-                    offset += msg_len
-
-            elapsed_time = time.perf_counter() - start_time
-            logger.info(
-                "Received %.2f GB in %.2fs. Speed: %.2f MiB/s ",
-                offset / (1024**3),
-                elapsed_time,
-                (offset / (1024**2)) / elapsed_time,
-            )
+        # Hash the data as it arrives, instead of buffering all of it first
+        hasher: BackgroundHasher | None = (
+            BackgroundHasher(new_hash()) if config.verify else None
+        )
+        offset: int = 0
+        logger.info("Receiving data from client")
+        start_time = time.perf_counter()
+        if isinstance(ws, web.WebSocketResponse):
+            logger.info("WebSocket type: SERVER")
+            async for msg in ws:
+                if msg.type is _WS_ERROR:
+                    logger.error("WebSocket error: %r", ws.exception())
+                    return
+
+                if msg.type is _WS_BINARY:
+                    if hasher is not None:
+                        await hasher.update(msg.data)
+                    offset += len(msg.data)
+        else:
+            # Take every buffered message per wakeup, instead of one await each
+            closed: bool = False
+            while not closed:
+                try:
+                    batch = await ws.recv_batch(config.recv_queue or 256)
+                except WebSocketClosed:
+                    break
+                for msg, flags in batch:
+                    if flags & CurlWsFlag.CLOSE:
+                        closed = True
+                        break
+                    if hasher is not None:
+                        await hasher.update(msg)
+                    offset += len(msg)
+
+        elapsed_time = time.perf_counter() - start_time
+        logger.info(
+            "Received %.2f GB in %.2fs. Speed: %.2f MiB/s ",
+            offset / (1024**3),
+            elapsed_time,
+            (offset / (1024**2)) / elapsed_time,
+        )
 
-            if offset < config.total_bytes - config.chunk_size:
-                logger.error("Incomplete file received, skipping hash check")
-                return
+        if hasher is None:
+            return
 
-            # Calculate and compare hashes
-            logger.info("Calculating hash of received data")
-            start_time = time.perf_counter()
-            received_hash = hashlib.sha256(testdata_buffer).hexdigest()
-            elapsed_time = time.perf_counter() - start_time
-            logger.info(
-                "Hash calculated in %.2fs. Speed: %.2f MiB/s ",
-                elapsed_time,
-                (offset / (1024**2)) / elapsed_time,
-            )
-            compare_hash(source_hash, received_hash)
+        if offset < config.total_bytes - config.chunk_size:
+            logger.error("Incomplete file received, skipping hash check")
+            return
+
+        compare_hash(source_hash, await hasher.digest())
 
     # pylint: disable-next=broad-exception-caught
     except Exception:
         logger.exception("Failed to receive data from client")
 
 
-async def send_benchmark_handler(ws: web.WebSocketResponse | AsyncWebSocket) -> None:
+async def send_benchmark_handler(
+    ws: web.WebSocketResponse | AsyncWebSocket,
+    transport: asyncio.BaseTransport | None = None,
+) -> None:
     """Handle the upload benchmark either as a server or client.
 
     Args:
         ws (web.WebSocketResponse | AsyncWebSocket): AIOHTTP or Curl-CFFI WebSocket.
+        transport (asyncio.BaseTransport | None): Server connection transport, used
+            to send the file with ``sendfile`` on plain connections.
     """
     logger.info("Connected for upload benchmark")
     try:
@@ -227,8 +625,13 @@ async def send_benchmark_handler(ws: web.WebSocketResponse | AsyncWebSocket) ->
             return
 
         start_time: float = time.perf_counter()
-        async for chunk in stream_test_data():
-            await ws.send_bytes(chunk)
+        if can_sendfile(transport):
+            await sendfile_test_data(cast(asyncio.WriteTransport, transport))
+        elif isinstance(ws, AsyncWebSocket):
+            await send_test_data(ws)
+        else:
+            async for chunk in stream_test_data():
+                await ws.send_bytes(chunk)
 
         # Wait for all the data to be sent
         if isinstance(ws, AsyncWebSocket):
@@ -252,7 +655,7 @@ async def ws_handler(request: web.Request) -> web.WebSocketResponse:
         web.WebSocketResponse: Response object.
     """
     ws: web.WebSocketResponse = web.WebSocketResponse(
-        max_msg_size=config.server_max_msg
+        max_msg_size=config.server_max_msg, writer_limit=config.server_writer_limit
     )
     _ = await ws.prepare(request)
     logger.info(
@@ -264,7 +667,7 @@ async def ws_handler(request: web.Request) -> web.WebSocketResponse:
     if request.query.get("test") == "upload":
         await recv_benchmark_handler(ws)
     else:
-        await send_benchmark_handler(ws)
+        await send_benchmark_handler(ws, request.transport)
 
     return ws
 
@@ -299,15 +702,64 @@ def main() -> None:
     mode_opts: list[str] = ["generate", "server", "client"]
     client_opts: list[str] = ["download", "upload"]
     parser: ArgumentParser = ArgumentParser(
-        description="WebSocket Unidirectional Benchmark"
+        description="WebSocket Unidirectional Benchmark",
+        epilog=(
+            "Without TLS, the server sends the download data with sendfile. This "
+            "needs the standard asyncio event loop, under uvloop or winloop the "
+            "data is streamed from a memory mapping instead."
+        ),
     )
     _ = parser.add_argument("mode", choices=mode_opts, help="Operation", type=str)
     _ = parser.add_argument(
         "-t", "--test", choices=client_opts, default="download", type=str
     )
+    _ = parser.add_argument(
+        "--hash",
+        choices=["sha256", "sha256-tree", "blake3"],
+        default="sha256",
+        help="Hash used to verify the data, blake3 requires the blake3 package",
+        type=str,
+    )
+    _ = parser.add_argument(
+        "-w",
+        "--workers",
+        default=1,
+        help="Number of server processes sharing the port with SO_REUSEPORT",
+        type=int,
+    )
+    _ = parser.add_argument(
+        "--recv-queue",
+        default=config.recv_queue,
+        help="Client receive queue size in messages, 0 is unbounded",
+        type=int,
+    )
+    _ = parser.add_argument(
+        "--send-queue",
+        default=config.send_queue,
+        help="Client send queue size in messages, 0 is unbounded",
+        type=int,
+    )
+    _ = parser.add_argument(
+        "--message-kb",
+        default=config.stream_message_size // 1024,
+        help="Size of the messages sent by the client, in KiB",
+        type=int,
+    )
+    _ = parser.add_argument(
+        "--no-verify",
+        action="store_false",
+        dest="verify",
+        help="Only measure the throughput, skip hashing the received data",
+    )
     args: Namespace = parser.parse_args()
     args.mode = cast(str, args.mode)
     args.test = cast(str, args.test)
+    config.hash_name = cast(str, args.hash)
+    config.recv_queue = cast(int, args.recv_queue)
+    config.send_queue = cast(int, args.send_queue)
+    config.verify = cast(bool, args.verify)
+    config.stream_message_size = cast(int, args.message_kb) * 1024
+    tune_process()
 
     if args.mode == "generate":
         generate_files()
@@ -316,24 +768,21 @@ def main() -> None:
         app: web.Application = web.Application(logger=logger)
         _ = app.add_routes(routes=[web.get("/ws", ws_handler)])
         logger.info("Starting server on %s", config.srv_path)
+        reuse_port: bool = fork_workers(cast(int, args.workers))
         web.run_app(
             app,
             host=config.srv_host.exploded,
             port=config.srv_port,
-            loop=get_loop(),
+            loop=new_event_loop(),
             ssl_context=config.ssl_ctx,
-            access_log=logger,
+            reuse_port=reuse_port,
+            # Connections are logged by the handlers, no access log line to format
+            access_log=None,
             print=logger.debug,
         )
 
     elif args.mode == "client" and args.test in client_opts:
-        try:
-            # pylint: disable-next=import-outside-toplevel
-            import uvloop
-
-            uvloop.run(client_handler(args.test))
-        except ImportError:
-            asyncio.run(client_handler(args.test))
+        run_loop(client_handler(args.test))
 
     else:
         parser.print_help()
@@ -4,15 +4,20 @@ Cross-platform utility code for the WebSocket benchmarks.
 """
 
 import asyncio
+import gc
 import os
-from collections.abc import AsyncGenerator, Generator
+import socket
+import sys
+from collections.abc import AsyncGenerator, Callable, Coroutine, Generator
 from dataclasses import dataclass
 from enum import Enum, auto
 from ipaddress import IPv4Address
 from logging import DEBUG, Formatter, Logger, StreamHandler, getLogger
 from pathlib import Path
-from ssl import PROTOCOL_TLS_SERVER, SSLContext
-from typing import TextIO
+from ssl import OP_CIPHER_SERVER_PREFERENCE, PROTOCOL_TLS_SERVER, SSLContext
+from typing import Any, TextIO, TypeVar
+
+T = TypeVar("T")
 
 
 class BenchmarkDirection(Enum):
@@ -69,6 +74,10 @@ def get_ssl_ctx(cert_file: Path, cert_key: Path) -> SSLContext | None:
 
     ssl_context: SSLContext = SSLContext(PROTOCOL_TLS_SERVER)
     ssl_context.load_cert_chain(cert_file, cert_key)
+    # Prefer AES-128-GCM, which runs on AES-NI, over ChaCha20 for TLS 1.2 clients.
+    # TLS 1.3 suites can't be set from Python, their AES-GCM ones are the default.
+    ssl_context.set_ciphers("ECDHE+AES128+AESGCM:ECDHE+AESGCM:ECDHE+CHACHA20")
+    ssl_context.options |= OP_CIPHER_SERVER_PREFERENCE
     return ssl_context
 
 
@@ -78,13 +87,28 @@ class TestConfig:
     Configuration values, should be changed as needed.
 
     NOTE: On Linux madvise requires alignment of free chunks,
-    so ``large_chunk_size`` must be a page-aligned value.
+    so ``large_chunk_size`` must be a page-aligned value, and
+    ``populate_window`` a multiple of it.
+
+    ``ws_frame_size`` is the message size pushed by the simple benchmark server,
+    it must not exceed the client's ``max_message_size`` (4 MiB by default).
+    The aiohttp servers only await a drain after ``server_writer_limit`` bytes.
+    ``stream_message_size`` is the message size sent by the streaming client, it
+    must stay below ``server_max_msg``. Independently of it, curl_cffi sends
+    messages as 64 KiB frames.
+    ``recv_queue`` and ``send_queue`` bound the client queues in messages, 0 makes
+    them unbounded at the cost of memory when the other side falls behind.
     """
 
     total_gb: int = 10
     chunk_size: int = 65536
+    ws_frame_size: int = 1024**2
+    stream_message_size: int = 64 * 1024
     large_chunk_size: int = 4 * 1024**2
-    server_max_msg: int = 8 * 1024**2
+    random_arena_size: int = 64 * 1024**2
+    populate_window: int = 256 * 1024**2
+    server_max_msg: int = 32 * 1024**2
+    server_writer_limit: int = 16 * 1024**2
     total_bytes: int = total_gb * 1024**3
     recv_queue: int = 256
     send_queue: int = 256
@@ -92,6 +116,8 @@ class TestConfig:
     cert_key: Path = Path("localhost.key")
     data_filename: Path = Path("testdata.bin")
     hash_filename: Path = data_filename.with_suffix(".hash")
+    hash_name: str = "sha256"
+    verify: bool = True
     srv_host: IPv4Address = IPv4Address("127.0.0.1")
     srv_port: int = 4443
     ssl_ctx: SSLContext | None = get_ssl_ctx(cert_file, cert_key)
@@ -135,35 +161,152 @@ async def binary_data_generator(
         bytes_sent += current_chunk_size
 
 
-def get_loop() -> asyncio.AbstractEventLoop:
-    """Returns the correct event loop for the platform and what's installed.
+async def run_concurrently(*coros: Coroutine[Any, Any, None]) -> None:
+    """Run the given coroutines concurrently until all of them are done.
+    Uses a ``TaskGroup`` on Python 3.11+ and falls back to ``asyncio.gather``.
+    The last coroutine is awaited in the calling task, so a single coroutine
+    needs no extra task at all.
+
+    Args:
+        *coros (`Coroutine[Any, Any, None]`): The coroutines to run.
+    """
+    *others, last = coros
+    if not others:
+        await last
+    elif sys.version_info >= (3, 11):
+        async with asyncio.TaskGroup() as tg:
+            for coro in others:
+                _ = tg.create_task(coro)
+            await last
+    else:
+        _ = await asyncio.gather(*others, last)
+
+
+def get_loop_factory() -> Callable[[], asyncio.AbstractEventLoop]:
+    """Returns the event loop factory for the platform and what's installed.
+    Prefers ``winloop`` on Windows and ``uvloop`` elsewhere, falling back to the
+    default asyncio event loop when neither is available.
 
     Returns:
-        asyncio.AbstractEventLoop: The created and installed event loop.
+        Callable[[], asyncio.AbstractEventLoop]: Creates a new event loop.
     """
 
     try:
-        # pylint: disable-next=import-outside-toplevel
-        import uvloop
+        if sys.platform == "win32":
+            # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+            from winloop import new_event_loop
+        else:
+            # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+            from uvloop import new_event_loop
 
-        loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
     except ImportError:
-        loop = asyncio.new_event_loop()
+        logger.warning("uvloop/winloop not installed, using the default event loop")
+        return asyncio.new_event_loop
+
+    return new_event_loop
+
+
+# Resolved once, every benchmark entry point creates its loop with this
+new_event_loop: Callable[[], asyncio.AbstractEventLoop] = get_loop_factory()
 
+
+def run_loop(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a new event loop, like ``asyncio.run``.
+    Uses an ``asyncio.Runner`` on Python 3.11+, which cancels leftover tasks.
+
+    Args:
+        main (`Coroutine[Any, Any, T]`): The coroutine to run.
+
+    Returns:
+        T: The return value of the coroutine.
+    """
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            return runner.run(main)
+
+    loop: asyncio.AbstractEventLoop = new_event_loop()
     asyncio.set_event_loop(loop)
-    return loop
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        loop.close()
 
 
-def generate_random_chunks() -> Generator[bytes]:
-    """Generate chunks of random data up to a total size.
+def tune_process() -> None:
+    """Reduce the run to run noise of a benchmark process. On Linux, the process is
+    pinned to the CPUs listed in the ``BENCH_CPU`` environment variable, e.g. ``2``
+    or ``2,3``. Objects created during startup are moved out of the GC's reach and
+    the generation 0 threshold is raised, so collections don't interrupt transfers.
+    """
+    cpus: str | None = os.environ.get("BENCH_CPU")
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {int(cpu) for cpu in cpus.split(",")})
+        logger.info("Pinned to CPU(s) %s", cpus)
+
+    gc.freeze()
+    gc.set_threshold(700_000, 50, 50)
+
+
+def fork_workers(workers: int) -> bool:
+    """Fork the server into ``workers`` processes which all bind the same port with
+    ``SO_REUSEPORT``, so that the kernel balances new connections between them.
+    Must be called before the event loop is created. Each child loads its own TLS
+    context, an ``SSLContext`` should not be shared across a fork.
+
+    Args:
+        workers (`int`): Total number of server processes.
 
     Returns:
-        Generator[bytes]: Generator that yields random chunks.
+        bool: Whether the server socket must be bound with ``SO_REUSEPORT``.
     """
-    num_chunks: int = config.total_bytes // config.large_chunk_size
-    for _ in range(num_chunks):
-        yield os.urandom(config.large_chunk_size)
+    if workers <= 1:
+        return False
+
+    if not (hasattr(os, "fork") and hasattr(socket, "SO_REUSEPORT")):
+        logger.warning("SO_REUSEPORT is not supported, running a single worker")
+        return False
+
+    for _ in range(workers - 1):
+        if os.fork() == 0:
+            if config.ssl_ctx is not None:
+                config.ssl_ctx = get_ssl_ctx(config.cert_file, config.cert_key)
+            break
 
-    remaining_size: int = config.total_bytes % config.large_chunk_size
-    if remaining_size > 0:
-        yield os.urandom(remaining_size)
+    logger.info("Server worker %d started", os.getpid())
+    return True
+
+
+def generate_random_chunks(
+    total_bytes: int | None = None, start: int = 0
+) -> Generator[memoryview]:
+    """Generate chunks of random data up to a total size. A single arena of random
+    data is created up front and its chunks are yielded as views in a cycle, which
+    avoids calling os.urandom() for every chunk.
+
+    Every pass over the arena starts at another rotation of it, derived from the
+    position in the file. The data does not repeat with the arena size, so blocks
+    of the file that are reordered, duplicated or shifted change its hash.
+
+    Args:
+        total_bytes (int | None): Size to generate, ``config.total_bytes`` if unset.
+        start (int): Position of the first chunk in the file.
+
+    Returns:
+        Generator[memoryview]: Generator that yields random chunks.
+    """
+    chunk_size: int = config.large_chunk_size
+    arena_size: int = chunk_size * max(1, config.random_arena_size // chunk_size)
+    # The first chunk is repeated at the end, so a rotated chunk never wraps around
+    arena_data: bytearray = bytearray(os.urandom(arena_size))
+    arena_data += arena_data[:chunk_size]
+    arena: memoryview = memoryview(arena_data)
+    position: int = start
+    bytes_left: int = config.total_bytes if total_bytes is None else total_bytes
+    while bytes_left > 0:
+        current_chunk_size: int = min(chunk_size, bytes_left)
+        arena_pass, offset = divmod(position, arena_size)
+        # An odd stride makes the rotation of every pass distinct
+        offset = (offset + arena_pass * 4097) % arena_size
+        yield arena[offset : offset + current_chunk_size]
+        bytes_left -= current_chunk_size
+        position += current_chunk_size
@@ -10,7 +10,6 @@ Redistributed under license Apache-2.0
 import asyncio
 import atexit
 import errno
-import functools
 import select
 import socket
 import threading
@@ -95,8 +94,9 @@ class SelectorThread:
             lambda: self._real_loop.create_task(thread_manager_anext())
         )
 
-        self._readers: dict[_FileDescriptorLike, Callable] = {}
-        self._writers: dict[_FileDescriptorLike, Callable] = {}
+        # callback and its arguments, called directly instead of through a partial
+        self._readers: dict[_FileDescriptorLike, tuple[Callable, tuple[Any, ...]]] = {}
+        self._writers: dict[_FileDescriptorLike, tuple[Callable, tuple[Any, ...]]] = {}
 
         # Writing to _waker_w will wake up the selector thread, which
         # watches for _waker_r to be readable.
@@ -241,24 +241,24 @@ class SelectorThread:
     def _handle_event(
         self,
         fd: _FileDescriptorLike,
-        cb_map: dict[_FileDescriptorLike, Callable],
+        cb_map: dict[_FileDescriptorLike, tuple[Callable, tuple[Any, ...]]],
     ) -> None:
         try:
-            callback = cb_map[fd]
+            callback, args = cb_map[fd]
         except KeyError:
             return
-        callback()
+        callback(*args)
 
     def add_reader(
         self, fd: _FileDescriptorLike, callback: Callable[..., None], *args: Any
     ) -> None:
-        self._readers[fd] = functools.partial(callback, *args)
+        self._readers[fd] = (callback, args)
         self._wake_selector()
 
     def add_writer(
         self, fd: _FileDescriptorLike, callback: Callable[..., None], *args: Any
     ) -> None:
-        self._writers[fd] = functools.partial(callback, *args)
+        self._writers[fd] = (callback, args)
         self._wake_selector()
 
     def remove_reader(self, fd: _FileDescriptorLike) -> bool:
@@ -87,6 +87,13 @@ CURLPIPE_NOTHING = 0
 CURLPIPE_HTTP1 = 1  # deprecated
 CURLPIPE_MULTIPLEX = 2
 
+# timer_function keeps the armed timer if the new deadline is this close, in seconds
+TIMER_COALESCE_WINDOW = 0.001
+
+# Interval of the timeout safeguard, it backs off while curl's timer fires sooner
+FORCE_TIMEOUT_MIN_INTERVAL = 0.1
+FORCE_TIMEOUT_MAX_INTERVAL = 1.0
+
 
 """
 libcurl provides an event-based system for multiple handles with the following API:
@@ -121,19 +128,33 @@ def timer_function(curlm, timeout_ms: int, clientp: Any) -> int:
     """
     async_curl = ffi.from_handle(clientp)
 
-    # Cancel the timer anyway, if it's -1, yes, libcurl says it should be cancelled.
-    # If not, to add a new timer, we need to cancel the old timer.
-    if async_curl._timer:
-        async_curl._timer.cancel()  # If already called, cancel does nothing.
+    # Deadline on the loop clock, call_later would add the delay to it as well
+    when = async_curl._loop_time() + timeout_ms * 0.001
+
+    # _timer is only set while it has not fired, see AsyncCurl._on_timer
+    timer = async_curl._timer
+    if timer is not None:
+        # libcurl updates the timer on most events, often to the same deadline.
+        # Keep the armed timer then, instead of cancelling and re-adding it.
+        if (
+            timeout_ms >= 0
+            and abs(async_curl._timer_when - when) < TIMER_COALESCE_WINDOW
+        ):
+            return 0
+        timer.cancel()
         async_curl._timer = None
 
-    # libcurl says to install a timer which calls socket_action on fire.
-    async_curl._timer = async_curl.loop.call_later(
-        timeout_ms / 1000,
-        async_curl.process_data,
-        CURL_SOCKET_TIMEOUT,  # -1
-        CURL_POLL_NONE,  # 0
-    )
+    # -1 means the timer should be deleted, which is done above
+    if timeout_ms < 0:
+        return 0
+
+    # libcurl says to install a timer which calls socket_action on fire. Timeout 0
+    # means as soon as possible, which needs no entry in the loop's timer heap.
+    if timeout_ms == 0:
+        async_curl._timer = async_curl._call_soon(async_curl._on_timer)
+    else:
+        async_curl._timer = async_curl._call_at(when, async_curl._on_timer)
+    async_curl._timer_when = when
 
     return 0
 
@@ -144,26 +165,35 @@ def socket_function(curl, sockfd: int, what: int, clientp: Any, data: Any) -> in
     sockets"""
 
     async_curl = ffi.from_handle(clientp)
-    loop = async_curl.loop
-
-    # Always remove and re-add fds
-    if sockfd in async_curl._sockfds:
-        loop.remove_reader(sockfd)
-        loop.remove_writer(sockfd)
-
-    # Need to read from the socket
-    if what & CURL_POLL_IN:
-        loop.add_reader(sockfd, async_curl.process_data, sockfd, CURL_CSELECT_IN)
-        async_curl._sockfds.add(sockfd)
+    sock_state = async_curl._sock_state
+
+    # Only add or remove the directions that changed since the last call
+    old_what = sock_state.get(sockfd, CURL_POLL_NONE)
+    new_what = CURL_POLL_NONE if what == CURL_POLL_REMOVE else what
+    changed = old_what ^ new_what
+
+    # Need to read from the socket, or not anymore
+    if changed & CURL_POLL_IN:
+        if new_what & CURL_POLL_IN:
+            async_curl._add_reader(
+                sockfd, async_curl._process_data, sockfd, CURL_CSELECT_IN
+            )
+        else:
+            async_curl._remove_reader(sockfd)
 
-    # Need to write to the socket
-    if what & CURL_POLL_OUT:
-        loop.add_writer(sockfd, async_curl.process_data, sockfd, CURL_CSELECT_OUT)
-        async_curl._sockfds.add(sockfd)
+    # Need to write to the socket, or not anymore
+    if changed & CURL_POLL_OUT:
+        if new_what & CURL_POLL_OUT:
+            async_curl._add_writer(
+                sockfd, async_curl._process_data, sockfd, CURL_CSELECT_OUT
+            )
+        else:
+            async_curl._remove_writer(sockfd)
 
-    # Need to remove the socket
-    if what == CURL_POLL_REMOVE:
-        async_curl._sockfds.remove(sockfd)
+    if new_what:
+        sock_state[sockfd] = new_what
+    else:
+        sock_state.pop(sockfd, None)
 
     return 0
 
@@ -180,14 +210,28 @@ class AsyncCurl:
         """
         self._curlm = lib.curl_multi_init()
         self._cacert = cacert or DEFAULT_CACERT
-        self._curl2future: dict[Curl, asyncio.Future] = {}  # curl to future map
-        self._curl2curl: dict[ffi.CData, Curl] = {}  # c curl to Curl
-        self._sockfds: set[int] = set()  # sockfds
+        # c curl to its Curl and the future of the transfer
+        self._handles: dict[ffi.CData, tuple[Curl, asyncio.Future]] = {}
+        self._sock_state: dict[int, int] = {}  # sockfd to CURL_POLL_* bits watched
         self.loop = get_selector(
             loop if loop is not None else asyncio.get_running_loop()
         )
-        self._timeout_checker = self.loop.create_task(self._force_timeout())
-        self._timer: Optional[asyncio.TimerHandle] = None
+        # Only runs while there are transfers, see add_handle
+        self._timeout_checker: Optional[asyncio.Task] = None
+        self._timer: Optional[asyncio.Handle] = None
+        self._timer_when = 0.0  # loop time the timer is due at
+        # Bound once, socket_function and timer_function use them for every event
+        self._add_reader = self.loop.add_reader
+        self._remove_reader = self.loop.remove_reader
+        self._add_writer = self.loop.add_writer
+        self._remove_writer = self.loop.remove_writer
+        self._call_soon = self.loop.call_soon
+        self._call_at = self.loop.call_at
+        self._loop_time = self.loop.time
+        self._process_data = self.process_data
+        # Out parameters of curl_multi_socket_action and curl_multi_info_read
+        self._running_handles = ffi.new("int *")
+        self._msg_in_queue = ffi.new("int *")
         self._setup()
 
     def _setup(self):
@@ -201,25 +245,32 @@ class AsyncCurl:
     async def close(self):
         """Close and cleanup running timers, readers, writers and handles."""
 
-        # Close and wait for the force timeout checker to complete
-        self._timeout_checker.cancel()
-        with suppress(asyncio.CancelledError):
-            await self._timeout_checker
+        # Close and wait for the force timeout checker to complete, it would keep
+        # running while transfers are still registered
+        if self._timeout_checker is not None:
+            self._timeout_checker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._timeout_checker
+            self._timeout_checker = None
 
         # Close all pending futures
-        for curl, future in self._curl2future.items():
+        for curl, future in self._handles.values():
             lib.curl_multi_remove_handle(self._curlm, curl._curl)
             if not future.done() and not future.cancelled():
                 future.set_result(None)
+        self._handles.clear()
 
         # Cleanup curl_multi handle
         lib.curl_multi_cleanup(self._curlm)
         self._curlm = None
 
         # Remove add readers and writers
-        for sockfd in self._sockfds:
-            self.loop.remove_reader(sockfd)
-            self.loop.remove_writer(sockfd)
+        for sockfd, what in self._sock_state.items():
+            if what & CURL_POLL_IN:
+                self._remove_reader(sockfd)
+            if what & CURL_POLL_OUT:
+                self._remove_writer(sockfd)
+        self._sock_state.clear()
 
         # Cancel all time functions
         if self._timer:
@@ -227,12 +278,29 @@ class AsyncCurl:
 
     async def _force_timeout(self):
         """This coroutine is used to safeguard from any missing signals from curl, and
-        put everything back on track"""
-        while True:
-            if not self._curlm:
-                break
-            self.socket_action(CURL_SOCKET_TIMEOUT, CURL_POLL_NONE)
-            await asyncio.sleep(0.1)
+        put everything back on track. It stops when there are no transfers left, so
+        an idle AsyncCurl does not wake up the loop.
+
+        When the timer curl asked for in timer_function fires before the next check,
+        curl will be called by it anyway, so the check is skipped and the interval
+        backs off. curl keeps a timer armed for most transfers, the check still runs
+        whenever that timer is further away than the interval."""
+        interval = FORCE_TIMEOUT_MIN_INTERVAL
+        while self._curlm and self._handles:
+            if (
+                self._timer is not None
+                and self._timer_when <= self.loop.time() + interval
+            ):
+                interval = min(interval * 2, FORCE_TIMEOUT_MAX_INTERVAL)
+            else:
+                self.socket_action(CURL_SOCKET_TIMEOUT, CURL_POLL_NONE)
+                interval = FORCE_TIMEOUT_MIN_INTERVAL
+            await asyncio.sleep(interval)
+
+    def _on_timer(self):
+        """Run socket_action for the timer curl asked for in timer_function."""
+        self._timer = None
+        self.process_data(CURL_SOCKET_TIMEOUT, CURL_POLL_NONE)
 
     def add_handle(self, curl: Curl):
         """Add a curl handle to be managed by curl_multi. This is the equivalent of
@@ -242,19 +310,19 @@ class AsyncCurl:
         errcode = lib.curl_multi_add_handle(self._curlm, curl._curl)
         self._check_error(errcode)
         future = self.loop.create_future()
-        self._curl2future[curl] = future
-        self._curl2curl[curl._curl] = curl
+        self._handles[curl._curl] = (curl, future)
+        if self._timeout_checker is None or self._timeout_checker.done():
+            self._timeout_checker = self.loop.create_task(self._force_timeout())
         return future
 
     def socket_action(self, sockfd: int, ev_bitmask: int) -> int:
         """wrapper for curl_multi_socket_action,
         returns the number of running curl handles."""
-        running_handle = ffi.new("int *")
         errcode = lib.curl_multi_socket_action(
-            self._curlm, sockfd, ev_bitmask, running_handle
+            self._curlm, sockfd, ev_bitmask, self._running_handles
         )
         self._check_error(errcode)
-        return running_handle[0]
+        return self._running_handles[0]
 
     def process_data(self, sockfd: int, ev_bitmask: int):
         """Call curl_multi_info_read to read data for given socket."""
@@ -268,38 +336,43 @@ class AsyncCurl:
 
         self.socket_action(sockfd, ev_bitmask)
 
-        msg_in_queue = ffi.new("int *")
+        # Most events finish no transfer, and the first read already returns NULL
+        info_read = lib.curl_multi_info_read
+        curlm = self._curlm
+        msg_in_queue = self._msg_in_queue
+        null = ffi.NULL
+        handles = self._handles
         while True:
-            try:
-                curl_msg = lib.curl_multi_info_read(self._curlm, msg_in_queue)
-                # NULL is returned as a signal that no more to be get at this point
-                if curl_msg == ffi.NULL:
-                    break
-                if curl_msg.msg == CURLMSG_DONE:
-                    curl = self._curl2curl[curl_msg.easy_handle]
-                    retcode = curl_msg.data.result
-                    callback_exception = curl._get_callback_exception()
-                    if callback_exception is not None:
-                        self.set_exception(curl, callback_exception)
-                    elif retcode == 0:
-                        self.set_result(curl)
-                    else:
-                        self.set_exception(curl, curl._get_error(retcode, "perform"))
-                else:
-                    print("NOT DONE")  # Will not reach, for nothing else being defined.
-            except Exception:
-                warnings.warn(
-                    "Unexpected curl multi state in process_data, "
-                    "please open an issue on GitHub\n",
-                    CurlCffiWarning,
-                    stacklevel=2,
-                )
+            curl_msg = info_read(curlm, msg_in_queue)
+            # NULL is returned as a signal that no more to be get at this point
+            if curl_msg == null:
+                break
+            # CURLMSG_DONE is the only message libcurl defines, skip anything else
+            if curl_msg.msg != CURLMSG_DONE:
+                continue
+            handle = handles.get(curl_msg.easy_handle)
+            # Already removed, e.g. cancelled while the message was queued
+            if handle is None:
+                continue
+            curl = handle[0]
+            retcode = curl_msg.data.result
+            callback_exception = curl._get_callback_exception()
+            if callback_exception is not None:
+                self.set_exception(curl, callback_exception)
+            elif retcode == 0:
+                self.set_result(curl)
+            else:
+                self.set_exception(curl, curl._get_error(retcode, "perform"))
 
     def _pop_future(self, curl: Curl):
         errcode = lib.curl_multi_remove_handle(self._curlm, curl._curl)
         self._check_error(errcode)
-        self._curl2curl.pop(curl._curl, None)
-        return self._curl2future.pop(curl, None)
+        handle = self._handles.pop(curl._curl, None)
+        # Stop the safeguard with the last transfer, not after its next sleep
+        if not self._handles and self._timeout_checker is not None:
+            self._timeout_checker.cancel()
+            self._timeout_checker = None
+        return handle[1] if handle is not None else None
 
     def remove_handle(self, curl: Curl):
         """Cancel a future for given curl handle."""
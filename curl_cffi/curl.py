@@ -7,6 +7,7 @@ import ssl
 import sys
 import warnings
 from http.cookies import SimpleCookie
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, cast
 
@@ -36,7 +37,6 @@ def _default_cacert() -> str:
 
 
 DEFAULT_CACERT = _default_cacert()
-REASON_PHRASE_RE = re.compile(rb"HTTP/\d\.\d [0-9]{3} (.*)")
 STATUS_LINE_RE = re.compile(rb"HTTP/(\d\.\d) ([0-9]{3}) (.*)")
 
 if TYPE_CHECKING:
@@ -159,12 +159,25 @@ def debug_function_default(type_: int, data: bytes) -> None:
             sys.stderr.write(f"{prefix} [{len(data)} bytes]: {hex_str}{postfix}\n")
 
 
+def _buffer_writer(buffer: Any) -> Any:
+    """Returns a function that appends a cffi buffer to ``buffer``.
+
+    ``bytearray`` and ``BytesIO`` copy the data on their own, so they can take the
+    cffi buffer directly. Other file-like objects may keep a reference to what they
+    are given, thus they still receive a ``bytes`` copy."""
+    if type(buffer) is bytearray:
+        return buffer.extend
+    if type(buffer) is BytesIO:
+        return buffer.write
+    return lambda data: buffer.write(data[:])
+
+
 @ffi.def_extern(onerror=_store_callback_error(CURL_WRITEFUNC_ERROR))
 def buffer_callback(ptr, size, nmemb, userdata):
     """ffi callback for curl write function, directly writes to a buffer"""
     # assert size == 1
-    buffer = ffi.from_handle(userdata).callback
-    buffer.write(ffi.buffer(ptr, nmemb)[:])
+    write = ffi.from_handle(userdata).callback
+    write(ffi.buffer(ptr, nmemb))
     return nmemb * size
 
 
@@ -179,7 +192,7 @@ def write_callback(ptr, size, nmemb, userdata):
     """ffi callback for curl write function, calls the callback python function"""
     # although similar enough to the function above, kept here for performance reasons
     callback = ffi.from_handle(userdata).callback
-    wrote = callback(ffi.buffer(ptr, nmemb)[:])
+    wrote = callback(ffi.unpack(ptr, nmemb))
     wrote = ensure_int(wrote)
     if wrote == CURL_WRITEFUNC_PAUSE or wrote == CURL_WRITEFUNC_ERROR:  # noqa: SIM109
         return wrote
@@ -256,6 +269,131 @@ def slist_to_list(head) -> list[bytes]:
     return result
 
 
+_INPUT_OPTION = {
+    # this should be int in curl, but cffi requires pointer for void*
+    # it will be convert back in the glue c code.
+    0: "long*",
+    10000: "char*",
+    20000: "void*",
+    30000: "int64_t*",  # offset type
+    40000: "void*",  # blob type
+}
+
+# The value type only depends on the option number, so classify them once.
+_OPTION_VALUE_TYPE: dict[int, str | None] = {
+    opt: _INPUT_OPTION.get((opt // 10000) * 10000) for opt in CurlOpt
+}
+
+# char* options holding local file paths, see the encoding note in Curl.setopt
+_FILEPATH_OPTIONS = frozenset(
+    {
+        CurlOpt.CAINFO,
+        CurlOpt.CAPATH,
+        CurlOpt.PROXY_CAINFO,
+        CurlOpt.PROXY_CAPATH,
+        CurlOpt.SSLCERT,
+        CurlOpt.SSLKEY,
+        CurlOpt.CRLFILE,
+        CurlOpt.ISSUERCERT,
+        CurlOpt.SSH_PUBLIC_KEYFILE,
+        CurlOpt.SSH_PRIVATE_KEYFILE,
+        CurlOpt.COOKIEFILE,
+        CurlOpt.COOKIEJAR,
+        CurlOpt.NETRC_FILE,
+        CurlOpt.UNIX_SOCKET_PATH,
+    }
+)
+
+# slist options, appended to the list kept in the given attribute
+_SLIST_OPTIONS = {
+    CurlOpt.HTTPHEADER: "_headers",
+    CurlOpt.HTTP3_HTTPHEADER: "_http3_headers",
+    CurlOpt.WS_HTTPHEADER: "_ws_headers",
+    CurlOpt.PROXYHEADER: "_proxy_headers",
+    CurlOpt.RESOLVE: "_resolve",
+}
+
+# Callback options, as (*DATA option passed to curl, *FUNCTION option, C callback,
+# attribute keeping the handle alive, whether the value is a buffer to write to).
+_CALLBACK_OPTIONS = {
+    CurlOpt.WRITEDATA: (
+        CurlOpt.WRITEDATA,
+        CurlOpt.WRITEFUNCTION,
+        lib.buffer_callback,
+        "_write_handle",
+        True,
+    ),
+    CurlOpt.HEADERDATA: (
+        CurlOpt.HEADERDATA,
+        CurlOpt.HEADERFUNCTION,
+        lib.buffer_callback,
+        "_header_handle",
+        True,
+    ),
+    CurlOpt.READDATA: (
+        CurlOpt.READDATA,
+        CurlOpt.READFUNCTION,
+        lib.read_buffer_callback,
+        "_read_handle",
+        False,
+    ),
+    CurlOpt.SEEKDATA: (
+        CurlOpt.SEEKDATA,
+        CurlOpt.SEEKFUNCTION,
+        lib.seek_buffer_callback,
+        "_seek_handle",
+        False,
+    ),
+    CurlOpt.WRITEFUNCTION: (
+        CurlOpt.WRITEDATA,
+        CurlOpt.WRITEFUNCTION,
+        lib.write_callback,
+        "_write_handle",
+        False,
+    ),
+    CurlOpt.HEADERFUNCTION: (
+        CurlOpt.HEADERDATA,
+        CurlOpt.HEADERFUNCTION,
+        lib.write_callback,
+        "_header_handle",
+        False,
+    ),
+    CurlOpt.READFUNCTION: (
+        CurlOpt.READDATA,
+        CurlOpt.READFUNCTION,
+        lib.read_callback,
+        "_read_handle",
+        False,
+    ),
+    CurlOpt.DEBUGFUNCTION: (
+        CurlOpt.DEBUGDATA,
+        CurlOpt.DEBUGFUNCTION,
+        lib.debug_function,
+        "_debug_handle",
+        False,
+    ),
+}
+
+# getinfo return types and casts, keyed by the type bits of the CurlInfo value
+_INFO_TYPE = {
+    0x100000: "char**",
+    0x200000: "long*",
+    0x300000: "double*",
+    0x400000: "struct curl_slist **",
+    0x500000: "long*",
+    0x600000: "int64_t*",
+}
+
+_INFO_CAST = {
+    0x100000: ffi.string,
+    0x200000: int,
+    0x300000: float,
+    0x400000: list,
+    0x500000: int,
+    0x600000: int,
+}
+
+
 class Curl:
     """
     Wrapper for ``curl_easy_*`` functions of libcurl.
@@ -285,6 +423,12 @@ class Curl:
         self._body_handle: Any = None
         self._read_handle: Any = None
         self._seek_handle: Any = None
+        # callback contexts behind the handles above, keyed by the *DATA option
+        self._callback_contexts: dict[CurlOpt, _CallbackContext] = {}
+        # Scratch cells for integer options. The glue code dereferences them before
+        # calling curl_easy_setopt, so the same cell can be reused for every call.
+        self._long_slot = ffi.new("long*")
+        self._off_t_slot = ffi.new("int64_t*")
         # TODO: use CURL_ERROR_SIZE
         self._error_buffer = ffi.new("char[]", 256)
         self._debug = debug
@@ -295,6 +439,8 @@ class Curl:
         self._ws_recv_n_recv = ffi.new("size_t *")
         self._ws_recv_p_frame = ffi.new("struct curl_ws_frame **")
         self._ws_send_n_sent = ffi.new("size_t *")
+        # Total websocket bytes received and sent, updated by the C glue code
+        self._ws_bytes = ffi.new("uint64_t[2]")
 
     def _set_error_buffer(self) -> None:
         ret = lib._curl_easy_setopt(self._curl, CurlOpt.ERRORBUFFER, self._error_buffer)
@@ -330,18 +476,18 @@ class Curl:
                 code=cast(CurlECode, errcode),
             )
 
+    def _new_callback_handle(self, data_option: CurlOpt, callback: Any) -> Any:
+        """Creates the cffi handle passed as ``data_option`` to a callback. The
+        context is also kept here, so checking for errors does not need
+        ``ffi.from_handle``."""
+        context = _CallbackContext(callback)
+        self._callback_contexts[data_option] = context
+        return ffi.new_handle(context)
+
     def _get_callback_exception(self) -> BaseException | None:
-        for handle in (
-            self._write_handle,
-            self._header_handle,
-            self._debug_handle,
-            self._read_handle,
-            self._seek_handle,
-        ):
-            if handle is not None:
-                exception = ffi.from_handle(handle).exception
-                if exception is not None:
-                    return exception
+        for context in self._callback_contexts.values():
+            if context.exception is not None:
+                return context.exception
         return None
 
     def setopt(self, option: CurlOpt, value: Any) -> int:
@@ -356,91 +502,106 @@ class Curl:
         """
         if self._curl is None:
             return 0  # silently ignore if curl handle is None
-        input_option = {
-            # this should be int in curl, but cffi requires pointer for void*
-            # it will be convert back in the glue c code.
-            0: "long*",
-            10000: "char*",
-            20000: "void*",
-            30000: "int64_t*",  # offset type
-            40000: "void*",  # blob type
-        }
-        # print("option", option, "value", value)
 
-        # Convert value
-        value_type = input_option.get((option // 10000) * 10000)
-        if value_type == "long*" or value_type == "int64_t*":
-            c_value = ffi.new(value_type, value)
-        elif option == CurlOpt.WRITEDATA:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._write_handle = c_value
-            lib._curl_easy_setopt(
-                self._curl, CurlOpt.WRITEFUNCTION, lib.buffer_callback
-            )
-        elif option == CurlOpt.HEADERDATA:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._header_handle = c_value
-            lib._curl_easy_setopt(
-                self._curl, CurlOpt.HEADERFUNCTION, lib.buffer_callback
-            )
-        elif option == CurlOpt.READDATA:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._read_handle = c_value
-            lib._curl_easy_setopt(
-                self._curl, CurlOpt.READFUNCTION, lib.read_buffer_callback
-            )
-        elif option == CurlOpt.SEEKDATA:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._seek_handle = c_value
-            lib._curl_easy_setopt(
-                self._curl, CurlOpt.SEEKFUNCTION, lib.seek_buffer_callback
+        # IntEnum to int once, the lookups and comparisons below are on plain ints
+        opt_int, c_value = self._to_c_value(int(option), value)
+        ret = lib._curl_easy_setopt(self._curl, opt_int, c_value)
+        self._check_error(ret, "setopt", option, value)
+
+        if opt_int == CurlOpt.CAINFO:
+            self._is_cert_set = True
+
+        return ret
+
+    def setopt_batch(self, options: list[tuple[CurlOpt, Any]]) -> int:
+        """Set several options with a single call into the C glue code.
+
+        Values are converted the same way as in :meth:`setopt`, but curl is only
+        called once, and the options are set in the given order.
+
+        Args:
+            options: list of ``(option, value)`` pairs.
+
+        Returns:
+            0 if no error, see ``CurlECode``.
+        """
+        if self._curl is None:
+            return 0  # silently ignore if curl handle is None
+
+        n = len(options)
+        c_options = ffi.new("int[]", n)
+        c_values = ffi.new("void *[]", n)
+        # Every option gets its own integer cell, allocated together in two arrays
+        long_cells = ffi.new("long[]", n)
+        off_t_cells = ffi.new("int64_t[]", n)
+        # string buffers have to outlive the batch call
+        keepalive = []
+        for i, (option, value) in enumerate(options):
+            opt_int, c_value = self._to_c_value(
+                int(option), value, (long_cells + i, off_t_cells + i)
             )
-        elif option == CurlOpt.WRITEFUNCTION:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._write_handle = c_value
-            lib._curl_easy_setopt(self._curl, CurlOpt.WRITEFUNCTION, lib.write_callback)
-            option = CurlOpt.WRITEDATA
-        elif option == CurlOpt.HEADERFUNCTION:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._header_handle = c_value
-            lib._curl_easy_setopt(
-                self._curl, CurlOpt.HEADERFUNCTION, lib.write_callback
+            if isinstance(c_value, bytes):
+                # bytes can only be stored into a void* array through a cdata
+                c_value = ffi.from_buffer(c_value)
+            c_options[i] = opt_int
+            c_values[i] = ffi.NULL if c_value is None else c_value
+            keepalive.append(c_value)
+        failed = ffi.new("size_t *")
+        ret = lib._curl_easy_setopt_batch(self._curl, c_options, c_values, n, failed)
+        if ret != 0:
+            self._check_error(ret, "setopt", *options[failed[0]])
+
+        if any(option == CurlOpt.CAINFO for option, _ in options):
+            self._is_cert_set = True
+
+        return ret
+
+    def _to_c_value(
+        self, option: int, value: Any, cells: tuple[Any, Any] | None = None
+    ) -> tuple[int, Any]:
+        """Converts ``value`` to what ``_curl_easy_setopt`` expects for ``option``.
+
+        Callback options are replaced by their ``*DATA`` counterpart, so the option
+        to pass to curl is returned as well. Integers are written to the given
+        ``long*`` and ``int64_t*`` cells, by default to the cells shared by every
+        call, in which case the value must be used before the next one.
+        """
+        # Convert value
+        value_type = _OPTION_VALUE_TYPE.get(option)
+        if value_type is None:
+            value_type = _INPUT_OPTION.get((option // 10000) * 10000)
+        if value_type == "long*":
+            c_value = self._long_slot if cells is None else cells[0]
+            c_value[0] = value
+        elif value_type == "int64_t*":
+            c_value = self._off_t_slot if cells is None else cells[1]
+            c_value[0] = value
+        elif option in _CALLBACK_OPTIONS:
+            option, function_option, callback, handle_attr, to_buffer = (
+                _CALLBACK_OPTIONS[option]
             )
-            option = CurlOpt.HEADERDATA
-        elif option == CurlOpt.READFUNCTION:
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._read_handle = c_value
-            lib._curl_easy_setopt(self._curl, CurlOpt.READFUNCTION, lib.read_callback)
-            option = CurlOpt.READDATA
-        elif option == CurlOpt.DEBUGFUNCTION:
-            if value is True:
+            if to_buffer:
+                value = _buffer_writer(value)
+            elif value is True and option == CurlOpt.DEBUGDATA:
                 value = debug_function_default
-            c_value = ffi.new_handle(_CallbackContext(value))
-            self._debug_handle = c_value
-            lib._curl_easy_setopt(self._curl, CurlOpt.DEBUGFUNCTION, lib.debug_function)
-            option = CurlOpt.DEBUGDATA
+            c_value = self._new_callback_handle(option, value)
+            setattr(self, handle_attr, c_value)
+            lib._curl_easy_setopt(self._curl, function_option, callback)
+        elif option in _SLIST_OPTIONS:
+            slist_attr = _SLIST_OPTIONS[option]
+            c_value = getattr(self, slist_attr)
+            for item in value:
+                if isinstance(item, str):
+                    item = item.encode()
+                c_value = lib.curl_slist_append(c_value, item)
+            setattr(self, slist_attr, c_value)
+            return option, c_value
         elif value_type == "char*":
             if isinstance(value, str):
                 # Windows/libcurl expects ANSI code page for file paths (char*).
                 # Non-ASCII paths encoded as UTF-8 can trigger ErrCode 77.
                 # Encode file-path-like options using the system encoding on Windows.
-                filepath_opts = {
-                    CurlOpt.CAINFO,
-                    CurlOpt.CAPATH,
-                    CurlOpt.PROXY_CAINFO,
-                    CurlOpt.PROXY_CAPATH,
-                    CurlOpt.SSLCERT,
-                    CurlOpt.SSLKEY,
-                    CurlOpt.CRLFILE,
-                    CurlOpt.ISSUERCERT,
-                    CurlOpt.SSH_PUBLIC_KEYFILE,
-                    CurlOpt.SSH_PRIVATE_KEYFILE,
-                    CurlOpt.COOKIEFILE,
-                    CurlOpt.COOKIEJAR,
-                    CurlOpt.NETRC_FILE,
-                    CurlOpt.UNIX_SOCKET_PATH,
-                }
-                if sys.platform.startswith("win") and option in filepath_opts:
+                if sys.platform.startswith("win") and option in _FILEPATH_OPTIONS:
                     # Use the process ANSI code page to match what CRT fopen expects.
                     enc = locale.getpreferredencoding(False)
                     c_value = value.encode(enc, errors="strict")
@@ -454,38 +615,7 @@ class Curl:
         else:
             raise NotImplementedError(f"Option unsupported: {option}")
 
-        header_options = {
-            CurlOpt.HTTPHEADER: "_headers",
-            CurlOpt.HTTP3_HTTPHEADER: "_http3_headers",
-            CurlOpt.WS_HTTPHEADER: "_ws_headers",
-        }
-        if option in header_options:
-            headers_attr = header_options[option]
-            headers = getattr(self, headers_attr)
-            for header in value:
-                headers = lib.curl_slist_append(headers, header)
-            setattr(self, headers_attr, headers)
-            ret = lib._curl_easy_setopt(self._curl, option, headers)
-        elif option == CurlOpt.PROXYHEADER:
-            for proxy_header in value:
-                self._proxy_headers = lib.curl_slist_append(
-                    self._proxy_headers, proxy_header
-                )
-            ret = lib._curl_easy_setopt(self._curl, option, self._proxy_headers)
-        elif option == CurlOpt.RESOLVE:
-            for resolve in value:
-                if isinstance(resolve, str):
-                    resolve = resolve.encode()
-                self._resolve = lib.curl_slist_append(self._resolve, resolve)
-            ret = lib._curl_easy_setopt(self._curl, option, self._resolve)
-        else:
-            ret = lib._curl_easy_setopt(self._curl, option, c_value)
-        self._check_error(ret, "setopt", option, value)
-
-        if option == CurlOpt.CAINFO:
-            self._is_cert_set = True
-
-        return ret
+        return option, c_value
 
     def getinfo(self, option: CurlInfo) -> bytes | int | float | list[str | int]:
         """Wrapper for ``curl_easy_getinfo``. Gets information in response after
@@ -497,31 +627,14 @@ class Curl:
         Returns:
             value retrieved from last perform.
         """
-        ret_option = {
-            0x100000: "char**",
-            0x200000: "long*",
-            0x300000: "double*",
-            0x400000: "struct curl_slist **",
-            0x500000: "long*",
-            0x600000: "int64_t*",
-        }
-        ret_cast_option = {
-            0x100000: ffi.string,
-            0x200000: int,
-            0x300000: float,
-            0x400000: list,
-            0x500000: int,
-            0x600000: int,
-        }
-
         option_type = option & 0xF00000
 
         if self._curl is None:
             if option_type == 0x100000:
                 return b""
-            return ret_cast_option[option_type]()
+            return _INFO_CAST[option_type]()
 
-        c_value = ffi.new(ret_option[option_type])
+        c_value = ffi.new(_INFO_TYPE[option_type])
         ret = lib.curl_easy_getinfo(self._curl, option, c_value)
         self._check_error(ret, "getinfo", option)
         # cookielist and ssl_engines starts with 0x400000, see also: const.py
@@ -530,7 +643,7 @@ class Curl:
         if c_value[0] == ffi.NULL:
             return b""
 
-        return ret_cast_option[option_type](c_value[0])
+        return _INFO_CAST[option_type](c_value[0])
 
     def version(self) -> bytes:
         """Get the underlying libcurl version."""
@@ -613,6 +726,7 @@ class Curl:
         self._body_handle = None
         self._read_handle = None
         self._seek_handle = None
+        self._callback_contexts.clear()
 
         if clear_resolve:
             if self._resolve != ffi.NULL:
@@ -663,16 +777,28 @@ class Curl:
         """
         cookie: SimpleCookie = SimpleCookie()
         for header in headers:
-            if header.lower().startswith(b"set-cookie: "):
-                cookie.load(header[12:].decode())  # len("set-cookie: ") == 12
+            # Only lowercase the prefix, curl sends the name as the server wrote it
+            prefix = header[:12]  # len("set-cookie: ") == 12
+            if prefix == b"Set-Cookie: " or prefix.lower() == b"set-cookie: ":
+                cookie.load(header[12:].decode())
         return cookie
 
     @staticmethod
     def get_reason_phrase(status_line: bytes) -> bytes:
         """Extract reason phrase, like ``OK``, ``Not Found`` from response status
         line."""
-        m = REASON_PHRASE_RE.match(status_line)
-        return m.group(1) if m else b""
+        # The prefix has a fixed length, ``HTTP/x.y NNN ``, so slice instead of
+        # matching a regex.
+        if (
+            len(status_line) < 13
+            or not status_line.startswith(b"HTTP/")
+            or status_line[6] != 0x2E  # "."
+            or status_line[8] != 0x20  # " "
+            or status_line[12] != 0x20
+            or not (status_line[5:6] + status_line[7:8] + status_line[9:12]).isdigit()
+        ):
+            return b""
+        return status_line[13:].split(b"\n", 1)[0]
 
     @staticmethod
     def parse_status_line(status_line: bytes) -> tuple[CurlHttpVersion, int, bytes]:
@@ -722,12 +848,13 @@ class Curl:
         if self._curl is None:
             raise CurlError("Cannot receive websocket data on closed handle.")
 
-        if ret := lib.curl_ws_recv(
+        if ret := lib._curl_ws_recv(
             self._curl,
             self._ws_recv_buffer,
             self._WS_RECV_BUFFER_SIZE,
             self._ws_recv_n_recv,
             self._ws_recv_p_frame,
+            self._ws_bytes,
         ):
             self._check_error(ret, "WS_RECV")
 
@@ -737,6 +864,41 @@ class Curl:
             self._ws_recv_p_frame[0],
         )
 
+    def ws_recv_into(self, buffer: bytearray | memoryview) -> tuple[int, CurlWsFrame]:
+        """Receive a frame from a websocket connection into ``buffer``.
+
+        Unlike :meth:`ws_recv`, libcurl writes the content straight into the given
+        buffer, so there is no intermediate copy.
+
+        Args:
+            buffer: writable buffer to receive into, at most ``len(buffer)`` bytes
+                are received.
+
+        Returns:
+            a tuple of the number of bytes received and curl frame meta struct.
+
+        Raises:
+            CurlError: if failed.
+        """
+        if self._curl is None:
+            raise CurlError("Cannot receive websocket data on closed handle.")
+
+        c_buffer = ffi.from_buffer(buffer, require_writable=True)
+        ret = lib._curl_ws_recv(
+            self._curl,
+            c_buffer,
+            len(c_buffer),
+            self._ws_recv_n_recv,
+            self._ws_recv_p_frame,
+            self._ws_bytes,
+        )
+        # A raised error keeps this frame alive, it must not keep the buffer exported
+        del c_buffer
+        if ret:
+            self._check_error(ret, "WS_RECV")
+
+        return self._ws_recv_n_recv[0], self._ws_recv_p_frame[0]
+
     def ws_send(
         self, payload: bytes | memoryview, flags: CurlWsFlag | int = CurlWsFlag.BINARY
     ) -> int:
@@ -749,20 +911,47 @@ class Curl:
         Returns:
             The number of bytes sent.
 
+        Raises:
+            CurlError: if failed.
+        """
+        return self.ws_send_raw(ffi.from_buffer(payload), len(payload), flags)
+
+    def ws_send_raw(
+        self, buffer: Any, length: int, flags: CurlWsFlag | int = CurlWsFlag.BINARY
+    ) -> int:
+        """Send data from a cffi buffer to a websocket connection.
+
+        Unlike :meth:`ws_send`, the payload is not converted on every call. Use
+        ``ffi.from_buffer`` once to pin a payload, then send it, or a part of it
+        with pointer arithmetic, as many times as needed. The buffer must be kept
+        alive by the caller until this method returns.
+
+        Args:
+            buffer: cffi ``char[]`` or ``char *`` to send from.
+            length: number of bytes to send.
+            flags: websocket flag to set for the frame, default: binary.
+
+        Returns:
+            The number of bytes sent.
+
         Raises:
             CurlError: if failed.
         """
         if self._curl is None:
             raise CurlError("Cannot send websocket data on closed handle.")
 
-        if ret := lib.curl_ws_send(
+        ret = lib._curl_ws_send(
             self._curl,
-            ffi.from_buffer(payload),
-            len(payload),
+            buffer,
+            length,
             self._ws_send_n_sent,
             0,
             flags,
-        ):
+            self._ws_bytes,
+        )
+        # A raised error keeps this frame alive, it must not keep the buffer exported
+        del buffer
+        if ret:
             self._check_error(ret, "WS_SEND")
         return self._ws_send_n_sent[0]
 
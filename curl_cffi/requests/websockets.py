@@ -9,7 +9,7 @@ import struct
 import threading
 import warnings
 from asyncio import InvalidStateError
-from collections.abc import Awaitable, Callable, Generator
+from collections.abc import Awaitable, Callable, Generator, Iterable
 from contextlib import suppress
 from dataclasses import dataclass, field
 from enum import IntEnum
@@ -19,6 +19,7 @@ from random import uniform
 from select import select
 from typing import TYPE_CHECKING, Final, Literal, TypeVar, cast, final
 
+from .._wrapper import ffi
 from ..aio import CURL_SOCKET_BAD, get_selector
 from ..const import CurlECode, CurlFollow, CurlInfo, CurlOpt, CurlWsFlag
 from ..curl import Curl, CurlError
@@ -45,8 +46,9 @@ if TYPE_CHECKING:
     ON_ERROR_T = Callable[["WebSocket", CurlError], None]
     ON_OPEN_T = Callable[["WebSocket"], None]
     ON_CLOSE_T = Callable[["WebSocket", int, str], None]
-    RECV_QUEUE_ITEM = tuple[bytes, int]
-    SEND_QUEUE_ITEM = tuple[bytes | bytearray | memoryview, CurlWsFlag | int]
+    RECV_QUEUE_ITEM = tuple[bytes | bytearray, int]
+    BUFFER_T = bytes | bytearray | memoryview
+    SEND_QUEUE_ITEM = tuple[BUFFER_T | tuple[BUFFER_T, ...], CurlWsFlag | int]
 
 
 @dataclass
@@ -169,6 +171,16 @@ class BaseWebSocket:
         """The WebSocket close reason, if the connection has been closed."""
         return self._close_reason
 
+    @property
+    def bytes_received(self) -> int:
+        """Total number of payload bytes received on this connection."""
+        return self.curl._ws_bytes[0]
+
+    @property
+    def bytes_sent(self) -> int:
+        """Total number of payload bytes sent on this connection."""
+        return self.curl._ws_bytes[1]
+
     @staticmethod
     def _pack_close_frame(code: int, reason: bytes) -> bytes:
         return struct.pack("!H", code) + reason
@@ -512,23 +524,31 @@ class WebSocket(BaseWebSocket):
                 "Invalid active socket", CurlECode.NO_CONNECTION_AVAILABLE
             )
 
+        # Pin the payload once, and send the remaining part by pointer offset
+        c_payload = ffi.from_buffer(payload)
+        total_bytes = len(payload)
+
         # Loop checks for CurlECode.Again
         # https://curl.se/libcurl/c/curl_ws_send.html
         offset = 0
-        while offset < len(payload):
-            current_buffer = payload[offset:]
-
-            try:
-                n_sent = self.curl.ws_send(current_buffer, flags)
-            except CurlError as e:
-                if e.code == CurlECode.AGAIN:
-                    _, writeable, _ = select([], [sock_fd], [], 0.5)
-                    if not writeable:
-                        raise WebSocketError("Socket write timeout") from e
-                    continue
-                raise
+        try:
+            while offset < total_bytes:
+                try:
+                    n_sent = self.curl.ws_send_raw(
+                        c_payload + offset, total_bytes - offset, flags
+                    )
+                except CurlError as e:
+                    if e.code == CurlECode.AGAIN:
+                        _, writeable, _ = select([], [sock_fd], [], 0.5)
+                        if not writeable:
+                            raise WebSocketError("Socket write timeout") from e
+                        continue
+                    raise
 
-            offset += n_sent
+                offset += n_sent
+        finally:
+            # A raised error keeps this frame alive, drop the pin on the payload
+            del c_payload
 
         return offset
 
@@ -845,7 +865,7 @@ class AsyncWebSocket(BaseWebSocket):
             raise WebSocketClosed("WebSocket has been closed")
         return self
 
-    async def __anext__(self) -> bytes:
+    async def __anext__(self) -> bytes | bytearray:
         try:
             msg, flags = await self.recv()
         except WebSocketClosed:
@@ -914,17 +934,22 @@ class AsyncWebSocket(BaseWebSocket):
             self._write_loop(), name=f"{ws_id}-writer"
         )
 
-    async def recv(self, *, timeout: float | None = None) -> tuple[bytes, int]:
+    async def recv(
+        self, *, timeout: float | None = None
+    ) -> tuple[bytes | bytearray, int]:
         """Receive a WebSocket message.
 
         This method waits for and returns the next complete WebSocket message.
+        A message made of one frame larger than a single read is returned as the
+        ``bytearray`` it was received into, instead of being copied to ``bytes``.
 
         Args:
             timeout: How many seconds to wait for a message before raising
             a timeout error.
 
         Returns:
-            tuple[bytes, int]: A tuple with the received payload and flags.
+            tuple[bytes | bytearray, int]: A tuple with the received payload and
+            flags.
 
         Raises:
             WebSocketTimeout: If the timeout expires.
@@ -1026,6 +1051,36 @@ class AsyncWebSocket(BaseWebSocket):
 
         raise WebSocketClosed("Connection closed")
 
+    async def recv_batch(
+        self, max_messages: int = 256, *, timeout: float | None = None
+    ) -> list[tuple[bytes | bytearray, int]]:
+        """Receive all buffered WebSocket messages in one call.
+
+        Waits for at least one message like :meth:`recv`, then takes every other
+        message already waiting in the receive queue, up to ``max_messages``. This
+        saves one await per message when consuming a high-throughput stream.
+
+        Args:
+            max_messages: Max number of messages to return.
+            timeout: How many seconds to wait for the first message before raising
+            a timeout error.
+
+        Returns:
+            list[tuple[bytes | bytearray, int]]: The received payloads and flags,
+            in order.
+
+        Raises:
+            WebSocketTimeout: If the timeout expires.
+            WebSocketClosed: If the connection is closed.
+            WebSocketError: If a network-level transport error occurs.
+        """
+        batch: list[RECV_QUEUE_ITEM] = [await self.recv(timeout=timeout)]
+        get_nowait = self._receive_queue.get_nowait
+        with suppress(asyncio.QueueEmpty):
+            while len(batch) < max_messages:
+                batch.append(get_nowait())
+        return batch
+
     async def recv_str(self, *, timeout: float | None = None) -> str:
         """Receive a text frame.
 
@@ -1104,6 +1159,34 @@ class AsyncWebSocket(BaseWebSocket):
             to guarantee that the data has actually reached the socket.
         """
 
+        # cURL expects bytes
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+
+        await self._enqueue((payload, flags), timeout)
+
+    async def send_many(
+        self,
+        payloads: Iterable[bytes | bytearray | memoryview],
+        flags: CurlWsFlag | int = CurlWsFlag.BINARY,
+        timeout: float | None = None,
+    ) -> None:
+        """Send several buffers as a single WebSocket message, without joining them.
+
+        The buffers take one slot in the send queue and are transmitted back to back
+        as fragments of the same message, so no other message is interleaved.
+
+        Args:
+            payloads: Buffers making up the message payload, in order.
+            flags: Frame type flags (e.g., ``CurlWsFlag.TEXT`` / ``CurlWsFlag.BINARY``).
+            timeout: Max seconds to wait if the send queue is full.
+
+        For more info, see the docstring for :meth:`send()`
+        """
+        await self._enqueue((tuple(payloads), flags), timeout)
+
+    async def _enqueue(self, item: SEND_QUEUE_ITEM, timeout: float | None) -> None:
+        """Put an item in the send queue, waiting up to ``timeout`` if it is full."""
         if self._transport_exception is not None:
             raise self._transport_exception
 
@@ -1114,31 +1197,25 @@ class AsyncWebSocket(BaseWebSocket):
         if self._write_task is not None and self._write_task.done():
             raise WebSocketClosed("WebSocket writer terminated; cannot send")
 
-        # cURL expects bytes
-        if isinstance(payload, str):
-            payload = payload.encode("utf-8")
-
         try:
-            self._send_queue.put_nowait((payload, flags))
+            self._send_queue.put_nowait(item)
         except asyncio.QueueFull as exc:
             if self._terminated:
                 raise WebSocketClosed("WebSocket connection is terminated") from exc
 
-            # Check exception after encoding
+            # The transport may have failed since the check above
             if self._transport_exception is not None:
                 raise self._transport_exception from exc
 
             if timeout is not None:
                 try:
-                    await asyncio.wait_for(
-                        self._send_queue.put((payload, flags)), timeout
-                    )
+                    await asyncio.wait_for(self._send_queue.put(item), timeout)
                 except asyncio.TimeoutError as e:
                     raise WebSocketTimeout(
                         "Send queue full (network slow) - hit timeout enqueuing message"
                     ) from e
             else:
-                await self._send_queue.put((payload, flags))
+                await self._send_queue.put(item)
 
             # If we woke up because terminate() drained the queue, fail now.
             if self._transport_exception is not None:
@@ -1349,6 +1426,9 @@ class AsyncWebSocket(BaseWebSocket):
 
         # Cache locals to avoid repeated attribute lookups
         curl_ws_recv: Callable[[], tuple[bytes, CurlWsFrame]] = self.curl.ws_recv
+        curl_ws_recv_into: Callable[[memoryview], tuple[int, CurlWsFrame]] = (
+            self.curl.ws_recv_into
+        )
         queue_put_nowait: Callable[[RECV_QUEUE_ITEM], None] = (
             self._receive_queue.put_nowait
         )
@@ -1381,15 +1461,24 @@ class AsyncWebSocket(BaseWebSocket):
 
         # Message specific values
         recv_error_retries: int = 0
-        chunks: list[bytes] = []
+        chunks: list[bytes | bytearray] = []
         msg_size: int = 0
-        chunks_append: Callable[[bytes], None] = chunks.append
+        chunks_append: Callable[[bytes | bytearray], None] = chunks.append
         chunks_clear: Callable[[], None] = chunks.clear
+        # A frame larger than one read is received straight into a buffer of its
+        # full size, instead of being copied into a chunk per read and joined.
+        frame_buffer: bytearray = bytearray()
+        frame_view: memoryview | None = None
+        frame_pos: int = 0
 
         try:
             while not self.closed:
                 try:
-                    chunk, frame = curl_ws_recv()
+                    if frame_view is None:
+                        chunk, frame = curl_ws_recv()
+                    else:
+                        n_recv, frame = curl_ws_recv_into(frame_view[frame_pos:])
+                        frame_pos += n_recv
 
                 except CurlError as e:
                     should_retry: bool = False
@@ -1472,29 +1561,44 @@ class AsyncWebSocket(BaseWebSocket):
 
                 # Data Frames (Text / Binary / Cont)
                 if flags & data_mask:
-                    # Perform message size checks
-                    msg_size += len(chunk)
-                    if msg_size > max_msg_size:
-                        chunks_clear()
-                        self._finalize_connection(
-                            WebSocketError(
-                                (
-                                    f"Message too large: {msg_size} bytes "
-                                    f"(limit {max_msg_size} bytes). "
-                                    "Consider increasing max_message_size or "
-                                    "chunking the message."
-                                ),
-                                CurlECode.TOO_LARGE,
+                    if frame_view is None:
+                        # Perform message size checks, counting the rest of the
+                        # frame too, so an oversized frame is rejected upfront
+                        bytesleft: int = frame.bytesleft
+                        msg_size += len(chunk) + bytesleft
+                        if msg_size > max_msg_size:
+                            chunks_clear()
+                            self._finalize_connection(
+                                WebSocketError(
+                                    (
+                                        f"Message too large: {msg_size} bytes "
+                                        f"(limit {max_msg_size} bytes). "
+                                        "Consider increasing max_message_size or "
+                                        "chunking the message."
+                                    ),
+                                    CurlECode.TOO_LARGE,
+                                )
                             )
-                        )
-                        return
+                            return
 
-                    # Collect the chunk
-                    chunks_append(chunk)
+                        if bytesleft:
+                            frame_pos = len(chunk)
+                            frame_buffer = bytearray(frame_pos + bytesleft)
+                            frame_view = memoryview(frame_buffer)
+                            frame_view[:frame_pos] = chunk
+                        else:
+                            chunks_append(chunk)
+
+                    # The whole frame is in the buffer, collect it as one chunk
+                    # without copying it again
+                    elif not frame.bytesleft:
+                        frame_view.release()
+                        frame_view = None
+                        chunks_append(frame_buffer)
 
                     # If the message is complete, process and dispatch it
                     if not (flags & cont_flag or frame.bytesleft):
-                        message: bytes = (
+                        message: bytes | bytearray = (
                             chunks[0] if len(chunks) == 1 else b"".join(chunks)
                         )
                         chunks_clear()
@@ -1573,6 +1677,7 @@ class AsyncWebSocket(BaseWebSocket):
         control_frame_flags: int = CurlWsFlag.CLOSE | CurlWsFlag.PING | CurlWsFlag.PONG
         close_flag: int = int(CurlWsFlag.CLOSE)
         send_payload: Callable[..., Awaitable[bool]] = self._send_payload
+        send_parts: Callable[..., Awaitable[bool]] = self._send_parts
         queue_get: Callable[[], Awaitable[SEND_QUEUE_ITEM]] = self._send_queue.get
         queue_get_nowait: Callable[[], SEND_QUEUE_ITEM] = self._send_queue.get_nowait
         queue_done: Callable[[], None] = self._send_queue.task_done
@@ -1589,7 +1694,10 @@ class AsyncWebSocket(BaseWebSocket):
                     payload, flags = await queue_get()
 
                     try:
-                        if not await send_payload(payload, flags):
+                        if type(payload) is tuple:
+                            if not await send_parts(payload, flags):
+                                return
+                        elif not await send_payload(payload, flags):
                             return
 
                         if flags & close_flag:
@@ -1628,13 +1736,16 @@ class AsyncWebSocket(BaseWebSocket):
                             tuple[list[bytes | bytearray | memoryview], int]
                         ] = []
                         for payload, frame in batch:
+                            parts: list[bytes | bytearray | memoryview] = (
+                                list(payload) if type(payload) is tuple else [payload]
+                            )
                             if frame & control_frame_flags:
-                                coalesced.append(([payload], frame))
+                                coalesced.append((parts, frame))
                             else:
                                 if coalesced and coalesced[-1][1] == frame:
-                                    coalesced[-1][0].append(payload)
+                                    coalesced[-1][0].extend(parts)
                                 else:
-                                    coalesced.append(([payload], frame))
+                                    coalesced.append((parts, frame))
 
                         # Transmit the coalesced groups in their exact original order
                         for payloads, frame_group in coalesced:
@@ -1667,6 +1778,23 @@ class AsyncWebSocket(BaseWebSocket):
             if not self.closed:
                 self.terminate()
 
+    async def _send_parts(
+        self,
+        parts: tuple[bytes | memoryview | bytearray, ...],
+        flags: CurlWsFlag | int,
+    ) -> bool:
+        """
+        Send buffers as the consecutive fragments of a single message.
+        """
+        if not parts:
+            return await self._send_payload(b"", flags)
+
+        cont_flags: int = flags | CurlWsFlag.CONT
+        for part in parts[:-1]:
+            if not await self._send_payload(part, cont_flags):
+                return False
+        return await self._send_payload(parts[-1], flags)
+
     async def _send_payload(
         self, payload: bytes | memoryview | bytearray, flags: CurlWsFlag | int
     ) -> bool:
@@ -1674,7 +1802,7 @@ class AsyncWebSocket(BaseWebSocket):
         Optimized low-level sender with fragmentation logic.
         """
         # Cache locals to reduce lookup cost
-        curl_ws_send: Callable[[memoryview, CurlWsFlag | int], int] = self.curl.ws_send
+        curl_ws_send: Callable[..., int] = self.curl.ws_send_raw
         loop: asyncio.AbstractEventLoop = self.loop
         loop_time: Callable[[], float] = loop.time
         create_future: Callable[[], asyncio.Future[None]] = loop.create_future
@@ -1691,90 +1819,98 @@ class AsyncWebSocket(BaseWebSocket):
 
         # Message specific values
         base_flags: int = flags & ~cont_flag
-        view: memoryview = memoryview(payload)
-        total_bytes: int = view.nbytes
+        # Pin the payload once, fragments are sent by pointer offset without slicing
+        c_payload = ffi.from_buffer(payload)
+        total_bytes: int = len(c_payload)
         offset: int = 0
         write_retries: int = 0
         frame_end: int = 0
         current_flags: CurlWsFlag | int = flags
 
-        # Loop until the entire view is sent
-        while offset < total_bytes or (offset == 0 and total_bytes == 0):
-            # Boundary check: Calculate next fragment ONLY when needed
-            if offset == frame_end:
-                if total_bytes - offset > max_frame_size:
-                    frame_end = offset + max_frame_size
-                    current_flags = base_flags | cont_flag
-                else:
-                    frame_end = total_bytes
-                    current_flags = flags
+        try:
+            # Loop until the entire payload is sent
+            while offset < total_bytes or (offset == 0 and total_bytes == 0):
+                # Boundary check: Calculate next fragment ONLY when needed
+                if offset == frame_end:
+                    if total_bytes - offset > max_frame_size:
+                        frame_end = offset + max_frame_size
+                        current_flags = base_flags | cont_flag
+                    else:
+                        frame_end = total_bytes
+                        current_flags = flags
 
-            try:
-                # libcurl returns the number of bytes actually sent
-                n_sent: int = curl_ws_send(view[offset:frame_end], current_flags)
-
-                if n_sent == 0:
-                    # Handle 0-byte payload (Valid Empty Frame)
-                    if frame_end - offset == 0:
-                        return True
-
-                    # Raise AGAIN to jump to the existing wait logic below
-                    write_retries += 1
-                    if write_retries >= max_zero_writes:
-                        self._finalize_connection(
-                            WebSocketError(
-                                f"Writer stalled ({write_retries} attempts).",
-                                CurlECode.WRITE_ERROR,
+                try:
+                    # libcurl returns the number of bytes actually sent
+                    n_sent: int = curl_ws_send(
+                        c_payload + offset, frame_end - offset, current_flags
+                    )
+
+                    if n_sent == 0:
+                        # Handle 0-byte payload (Valid Empty Frame)
+                        if frame_end - offset == 0:
+                            return True
+
+                        # Raise AGAIN to jump to the existing wait logic below
+                        write_retries += 1
+                        if write_retries >= max_zero_writes:
+                            self._finalize_connection(
+                                WebSocketError(
+                                    f"Writer stalled ({write_retries} attempts).",
+                                    CurlECode.WRITE_ERROR,
+                                )
                             )
-                        )
-                        return False
+                            return False
 
-                    raise CurlError("0 bytes sent", e_again)
+                        raise CurlError("0 bytes sent", e_again)
 
-                if write_retries:
-                    write_retries = 0
+                    if write_retries:
+                        write_retries = 0
 
-                offset += n_sent
+                    offset += n_sent
 
-                # Cooperative yield checks
-                if loop_time() >= next_yield:
-                    await asyncio.sleep(0)
-                    next_yield = loop_time() + time_slice
+                    # Cooperative yield checks
+                    if loop_time() >= next_yield:
+                        await asyncio.sleep(0)
+                        next_yield = loop_time() + time_slice
 
-            except CurlError as e:
-                if e.code == e_again:
-                    # Wait for socket to be writable
-                    write_future: asyncio.Future[None] = create_future()
-                    try:
-                        add_writer(sock_fd, set_fut_result, write_future)
-                        await write_future
-
-                    # pylint: disable-next=broad-exception-caught
-                    except Exception as exc:
-                        self._finalize_connection(
-                            WebSocketError(
-                                f"Socket closed unexpectedly during write: {exc}",
-                                CurlECode.NO_CONNECTION_AVAILABLE,
+                except CurlError as e:
+                    if e.code == e_again:
+                        # Wait for socket to be writable
+                        write_future: asyncio.Future[None] = create_future()
+                        try:
+                            add_writer(sock_fd, set_fut_result, write_future)
+                            await write_future
+
+                        # pylint: disable-next=broad-exception-caught
+                        except Exception as exc:
+                            self._finalize_connection(
+                                WebSocketError(
+                                    f"Socket closed unexpectedly during write: {exc}",
+                                    CurlECode.NO_CONNECTION_AVAILABLE,
+                                )
                             )
-                        )
-                        return False
+                            return False
 
-                    finally:
-                        if sock_fd != -1:
-                            try:  # noqa: SIM105
-                                _ = remove_writer(sock_fd)
-                            # pylint: disable-next=broad-exception-caught
-                            except Exception:
-                                pass
-
-                    # Retry the exact same chunk
-                    continue
+                        finally:
+                            if sock_fd != -1:
+                                try:  # noqa: SIM105
+                                    _ = remove_writer(sock_fd)
+                                # pylint: disable-next=broad-exception-caught
+                                except Exception:
+                                    pass
 
-                # Fatal Error
-                self._finalize_connection(e)
-                return False
+                        # Retry the exact same chunk
+                        continue
 
-        return True
+                    # Fatal Error
+                    self._finalize_connection(e)
+                    return False
+
+            return True
+        finally:
+            # A fatal CurlError is kept in _transport_exception, and its traceback
+            # holds this frame. Drop the pin so the payload is not exported forever.
+            del c_payload
 
     async def flush(self, timeout: float | None = None) -> None:
         """Waits until all items in the send queue have been processed.
@@ -1,6 +1,8 @@
 // easy interfaces
 void *curl_easy_init();
 int _curl_easy_setopt(void *curl, int option, void *param);
+// same as above for n options, returns the first error and its index in failed
+int _curl_easy_setopt_batch(void *curl, const int *options, void **parameters, size_t n, size_t *failed);
 int curl_easy_getinfo(void *curl, int option, void *ret);
 int curl_easy_perform(void *curl);
 void curl_easy_cleanup(void *curl);
@@ -22,7 +24,7 @@ void curl_slist_free_all(struct curl_slist *list);
 
 // callbacks
 extern "Python" size_t buffer_callback(void *ptr, size_t size, size_t nmemb, void *userdata);
-extern "Python" size_t write_callback(void *ptr, size_t size, size_t nmemb, void *userdata);
+extern "Python" size_t write_callback(char *ptr, size_t size, size_t nmemb, void *userdata);
 extern "Python" size_t read_buffer_callback(void *ptr, size_t size, size_t nmemb, void *userdata);
 extern "Python" size_t read_callback(void *ptr, size_t size, size_t nmemb, void *userdata);
 extern "Python" int seek_buffer_callback(void *userdata, int64_t offset, int origin);
@@ -68,6 +70,9 @@ struct curl_ws_frame {
 
 int curl_ws_recv(void *curl, void *buffer, size_t buflen, size_t *recv, const struct curl_ws_frame **meta);
 int curl_ws_send(void *curl, const void *buffer, size_t buflen, size_t *sent, int fragsize, unsigned int sendflags);
+// same as above, but also add up the transferred bytes in counters[0] (recv) and counters[1] (send)
+int _curl_ws_recv(void *curl, void *buffer, size_t buflen, size_t *recv, const struct curl_ws_frame **meta, uint64_t *counters);
+int _curl_ws_send(void *curl, const void *buffer, size_t buflen, size_t *sent, int fragsize, unsigned int sendflags, uint64_t *counters);
 
 // mime
 void *curl_mime_init(void* curl);  // -> form
@@ -16,3 +16,36 @@ int _curl_easy_setopt(void* curl, int option, void* parameter) {
     }
     return (int)curl_easy_setopt(curl, (CURLoption)option, parameter);
 }
+
+int _curl_easy_setopt_batch(void *curl, const int *options, void **parameters,
+                            size_t n, size_t *failed) {
+    // stop at the first failure, and tell the caller which option it was
+    for (size_t i = 0; i < n; i++) {
+        int ret = _curl_easy_setopt(curl, options[i], parameters[i]);
+        if (ret != 0) {
+            *failed = i;
+            return ret;
+        }
+    }
+    return 0;
+}
+
+int _curl_ws_recv(void *curl, void *buffer, size_t buflen, size_t *recv,
+                  const struct curl_ws_frame **meta, uint64_t *counters) {
+    int ret = (int)curl_ws_recv(curl, buffer, buflen, recv, meta);
+    // counters[0] is the total number of bytes received
+    if (ret == CURLE_OK) {
+        counters[0] += *recv;
+    }
+    return ret;
+}
+
+int _curl_ws_send(void *curl, const void *buffer, size_t buflen, size_t *sent,
+                  int fragsize, unsigned int sendflags, uint64_t *counters) {
+    int ret = (int)curl_ws_send(curl, buffer, buflen, sent, fragsize, sendflags);
+    // counters[1] is the total number of bytes sent
+    if (ret == CURLE_OK) {
+        counters[1] += *sent;
+    }
+    return ret;
+}
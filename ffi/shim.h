@@ -1,7 +1,14 @@
 #include <stdlib.h>
 #include <string.h>
 #include <stdio.h>
+#include <stdint.h>
 #define CURL_STATICLIB
 #include "curl/curl.h"
 
 int _curl_easy_setopt(void* curl, int option, void* param);
+int _curl_easy_setopt_batch(void *curl, const int *options, void **parameters,
+                            size_t n, size_t *failed);
+int _curl_ws_recv(void *curl, void *buffer, size_t buflen, size_t *recv,
+                  const struct curl_ws_frame **meta, uint64_t *counters);
+int _curl_ws_send(void *curl, const void *buffer, size_t buflen, size_t *sent,
+                  int fragsize, unsigned int sendflags, uint64_t *counters);
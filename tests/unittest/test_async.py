@@ -1,6 +1,19 @@
+import asyncio
+from unittest.mock import Mock, call
+
 import pytest
 
 from curl_cffi import AsyncCurl, Curl, CurlOpt
+from curl_cffi.aio import (
+    CURL_CSELECT_IN,
+    CURL_CSELECT_OUT,
+    CURL_POLL_IN,
+    CURL_POLL_INOUT,
+    CURL_POLL_OUT,
+    CURL_POLL_REMOVE,
+    socket_function,
+    timer_function,
+)
 
 
 async def test_init(server):
@@ -44,3 +57,81 @@ async def test_socket_action(server):
 
 
 async def test_process_data(server): ...
+
+
+async def test_concurrent_handles(server):
+    ac = AsyncCurl()
+    curls = []
+    for _ in range(10):
+        c = Curl()
+        c.setopt(CurlOpt.URL, str(server.url).encode())
+        c.setopt(CurlOpt.WRITEFUNCTION, lambda x: len(x))
+        curls.append(c)
+    await asyncio.wait_for(asyncio.gather(*map(ac.add_handle, curls)), timeout=10)
+    await ac.close()
+
+
+async def test_close_with_pending_handle(server):
+    ac = AsyncCurl()
+    c = Curl()
+    c.setopt(CurlOpt.URL, str(server.url.copy_with(path="/slow_response")).encode())
+    c.setopt(CurlOpt.WRITEFUNCTION, lambda x: len(x))
+    fut = ac.add_handle(c)
+    checker = ac._timeout_checker
+    await ac.close()
+    # the safeguard is stopped, even though the transfer was not finished
+    assert checker is not None and checker.done()
+    assert not ac._handles
+    assert fut.done()
+
+
+async def test_timer_function_zero_timeout(server):
+    ac = AsyncCurl()
+    fired = []
+    ac._on_timer = lambda: fired.append(True)
+    timer_function(ac._curlm, 0, ac._self_handle)
+    # as soon as possible, without an entry in the loop's timer heap
+    assert not isinstance(ac._timer, asyncio.TimerHandle)
+    assert not fired
+    await asyncio.sleep(0)
+    assert fired
+    await ac.close()
+
+
+async def test_timer_function_same_deadline(server):
+    ac = AsyncCurl()
+    now = ac.loop.time()
+    ac._loop_time = lambda: now
+    timer_function(ac._curlm, 50, ac._self_handle)
+    timer = ac._timer
+    # the same deadline again keeps the armed timer
+    timer_function(ac._curlm, 50, ac._self_handle)
+    assert ac._timer is timer
+    assert not timer.cancelled()
+    # a new deadline replaces it
+    timer_function(ac._curlm, 100, ac._self_handle)
+    assert ac._timer is not timer
+    assert timer.cancelled()
+    # -1 deletes it
+    timer_function(ac._curlm, -1, ac._self_handle)
+    assert ac._timer is None
+    await ac.close()
+
+
+async def test_socket_function_changes(server):
+    ac = AsyncCurl()
+    loop = Mock()
+    ac._add_reader, ac._remove_reader = loop.add_reader, loop.remove_reader
+    ac._add_writer, ac._remove_writer = loop.add_writer, loop.remove_writer
+    sockfd = 42
+    for what in (CURL_POLL_IN, CURL_POLL_INOUT, CURL_POLL_OUT, CURL_POLL_REMOVE):
+        socket_function(None, sockfd, what, ac._self_handle, None)
+    # only the directions that changed are applied
+    assert loop.mock_calls == [
+        call.add_reader(sockfd, ac._process_data, sockfd, CURL_CSELECT_IN),
+        call.add_writer(sockfd, ac._process_data, sockfd, CURL_CSELECT_OUT),
+        call.remove_reader(sockfd),
+        call.remove_writer(sockfd),
+    ]
+    assert not ac._sock_state
+    await ac.close()
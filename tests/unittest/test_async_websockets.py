@@ -17,6 +17,7 @@ the AsyncWebSocket class across various scenarios including:
 from __future__ import annotations
 
 import asyncio
+import gc
 import queue
 import threading
 import unittest.mock
@@ -434,6 +435,15 @@ class TestAsyncWebSocketBasicConnectivity:
         assert data == b"hello"
         assert flags & CurlWsFlag.BINARY
 
+    async def test_byte_counters(self, ws_connection: AsyncWebSocket) -> None:
+        """Test transferred payload bytes are counted."""
+        assert ws_connection.bytes_sent == 0
+        assert ws_connection.bytes_received == 0
+        await ws_connection.send(b"hello")
+        _ = await ws_connection.recv()
+        assert ws_connection.bytes_sent == 5
+        assert ws_connection.bytes_received == 5
+
     async def test_echo_multiple_messages(self, ws_connection: AsyncWebSocket) -> None:
         """Test multiple message exchanges."""
         for i in range(10):
@@ -493,6 +503,21 @@ class TestAsyncWebSocketMessageTypes:
         data, _ = await ws_connection.recv()
         assert data == original
 
+    async def test_send_many(self, ws_connection: AsyncWebSocket) -> None:
+        """Test send_many delivers its buffers as a single message."""
+        original: bytes = bytes(range(256)) * 512
+        parts: list[bytes | bytearray | memoryview] = [
+            memoryview(original)[:1000],
+            original[1000:70000],
+            bytearray(original[70000:]),
+        ]
+        await ws_connection.send_many(parts)
+        await ws_connection.send(b"after")
+        data, _ = await ws_connection.recv()
+        assert data == original
+        data, _ = await ws_connection.recv()
+        assert data == b"after"
+
     async def test_recv_str_invalid_utf8(
         self, ws_connection: AsyncWebSocket, ws_config: Callable[..., None]
     ) -> None:
@@ -1084,6 +1109,24 @@ class TestAsyncWebSocketQueueBehavior:
                 except WebSocketTimeout:
                     break
 
+    async def test_recv_batch(
+        self,
+        session: AsyncSession[Response],
+        configurable_ws_server: ConfigurableWSServer,
+        ws_config: Callable[..., None],
+    ) -> None:
+        """Test recv_batch returns buffered messages in order."""
+        messages: list[str] = [f"msg_{i}" for i in range(10)]
+        ws_config(behavior=ServerBehavior.BROADCAST, broadcast_messages=messages)
+
+        async with session.ws_connect(configurable_ws_server.url) as ws:
+            received: list[str] = []
+            while len(received) < len(messages):
+                batch = await ws.recv_batch(max_messages=4, timeout=1.0)
+                assert 1 <= len(batch) <= 4
+                received.extend(data.decode() for data, _ in batch)
+            assert received == messages
+
     async def test_drain_on_error_false(
         self,
         session: AsyncSession[Response],
@@ -1655,11 +1698,11 @@ class TestAsyncWebSocketFragmentationFix:
         Forces a partial write to ensure _send_payload resumes the exact
         remaining bytes of the frame, avoiding the '(43) unaligned frame size' error.
         """
-        original_ws_send: Callable[..., int] = ws_connection.curl.ws_send
+        original_ws_send: Callable[..., int] = ws_connection.curl.ws_send_raw
         attempt_logs: list[tuple[int, int]] = []
 
-        def mock_ws_send(chunk: memoryview, flags: int) -> int:
-            chunk_len: int = len(chunk)
+        def mock_ws_send(buffer: object, length: int, flags: int) -> int:
+            chunk_len: int = length
 
             # On the very first large frame, simulate a full socket buffer
             # by refusing to accept more than 10,000 bytes.
@@ -1669,10 +1712,10 @@ class TestAsyncWebSocketFragmentationFix:
                 n_sent = chunk_len
 
             attempt_logs.append((chunk_len, n_sent))
-            return original_ws_send(chunk[:n_sent], flags)
+            return original_ws_send(buffer, n_sent, flags)
 
         with unittest.mock.patch.object(
-            ws_connection.curl, "ws_send", side_effect=mock_ws_send
+            ws_connection.curl, "ws_send_raw", side_effect=mock_ws_send
         ):
             # Send 100,000 bytes (Requires 2 frames: 65536 + 34464)
             payload: bytes = b"X" * 100000
@@ -1700,10 +1743,10 @@ class TestAsyncWebSocketFragmentationFix:
         Test that an EAGAIN error doesn't corrupt the frame boundary state.
         Verifies the zero-math hot-path retry optimization.
         """
-        original_ws_send: Callable[..., int] = ws_connection.curl.ws_send
+        original_ws_send: Callable[..., int] = ws_connection.curl.ws_send_raw
         call_count = 0
 
-        def mock_ws_send(chunk: memoryview, flags: int) -> int:
+        def mock_ws_send(buffer: object, length: int, flags: int) -> int:
             nonlocal call_count
             call_count += 1
 
@@ -1711,10 +1754,10 @@ class TestAsyncWebSocketFragmentationFix:
             if call_count == 1:
                 raise CurlError("Simulated EAGAIN", CurlECode.AGAIN)
 
-            return original_ws_send(chunk, flags)
+            return original_ws_send(buffer, length, flags)
 
         with unittest.mock.patch.object(
-            ws_connection.curl, "ws_send", side_effect=mock_ws_send
+            ws_connection.curl, "ws_send_raw", side_effect=mock_ws_send
         ):
             payload: bytes = b"Y" * 100000
             await ws_connection.send(payload)
@@ -2192,6 +2235,75 @@ class TestAsyncWebSocketRobustness:
         # Ensure nothing else leaked into the queue
         assert ws._receive_queue.empty()
 
+    @pytest.mark.asyncio
+    async def test_large_frame_received_into_buffer(self) -> None:
+        """
+        A frame larger than one read is received into a buffer of its full size,
+        and dispatched as a single message without copying it again.
+        """
+        mock_curl: Mock = Mock(spec=Curl)
+        ws: AsyncWebSocket = AsyncWebSocket(Mock(), mock_curl)
+        ws.closed = False
+
+        class MockFrameMeta:
+            def __init__(self, flags: int, bytesleft: int = 0) -> None:
+                self.flags: int = flags
+                self.bytesleft: int = bytesleft
+
+        # 4 bytes first, then the remaining 6 bytes in two reads
+        recv_sequence: Iterator[tuple[bytes, MockFrameMeta]] = iter(
+            [
+                (b"head", MockFrameMeta(CurlWsFlag.BINARY, 6)),
+                (b"bye", MockFrameMeta(CurlWsFlag.CLOSE)),
+            ]
+        )
+        into_sequence: Iterator[tuple[bytes, MockFrameMeta]] = iter(
+            [
+                (b"-mid", MockFrameMeta(CurlWsFlag.BINARY, 2)),
+                (b"-!", MockFrameMeta(CurlWsFlag.BINARY)),
+            ]
+        )
+
+        def recv_into(buffer: memoryview) -> tuple[int, MockFrameMeta]:
+            data, frame = next(into_sequence)
+            assert len(buffer) == frame.bytesleft + len(data)
+            buffer[: len(data)] = data
+            return len(data), frame
+
+        mock_curl.ws_recv.side_effect = lambda: next(recv_sequence)
+        mock_curl.ws_recv_into.side_effect = recv_into
+
+        await ws._read_loop()
+
+        msg, flags = ws._receive_queue.get_nowait()
+        assert type(msg) is bytearray
+        assert msg == b"head-mid-!"
+        assert flags == CurlWsFlag.BINARY
+        assert ws._receive_queue.get_nowait()[0] == b"bye"
+        assert ws._receive_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_fatal_send_error_releases_payload(self) -> None:
+        """
+        The error kept in _transport_exception holds the send frame through its
+        traceback. That frame must not keep the payload buffer exported.
+        """
+        mock_curl: Mock = Mock(spec=Curl)
+        mock_curl.ws_send_raw.side_effect = CurlError(
+            "Simulated send error", CurlECode.SEND_ERROR
+        )
+        ws: AsyncWebSocket = AsyncWebSocket(Mock(), mock_curl)
+        ws.closed = False
+
+        payload: bytearray = bytearray(b"Z" * 100)
+        assert not await ws._send_payload(payload, CurlWsFlag.BINARY)
+        assert isinstance(ws._transport_exception, CurlError)
+
+        # Resizing fails with BufferError while any export is still alive
+        payload.extend(b"Z")
+        del ws
+        _ = gc.collect()
+
     @pytest.mark.asyncio
     async def test_high_concurrency_mixed_frame_stress(
         self,
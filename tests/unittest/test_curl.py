@@ -120,6 +120,61 @@ def test_proxy_headers(server):
     assert "Foo" not in headers
 
 
+def test_write_data_bytearray(server):
+    c = Curl()
+    url = str(server.url.copy_with(path="/echo_body"))
+    c.setopt(CurlOpt.URL, url.encode())
+    c.setopt(CurlOpt.POSTFIELDS, b"foo=bar")
+    buffer = bytearray()
+    c.setopt(CurlOpt.WRITEDATA, buffer)
+    c.perform()
+    assert buffer == b"foo=bar"
+
+
+def test_setopt_batch(server):
+    c = Curl()
+    url = str(server.url.copy_with(path="/echo_headers"))
+    buffer = BytesIO()
+    c.setopt_batch(
+        [
+            (CurlOpt.URL, url.encode()),
+            (CurlOpt.HTTPHEADER, [b"Foo: bar"]),
+            (CurlOpt.TIMEOUT_MS, 5000),
+            (CurlOpt.WRITEDATA, buffer),
+        ]
+    )
+    c.perform()
+    headers = json.loads(buffer.getvalue().decode())
+    assert headers["Foo"][0] == "bar"
+
+
+def test_setopt_batch_error():
+    c = Curl()
+    # the error names the option that failed, not the first one in the batch
+    with pytest.raises(CurlError, match=rf"setopt {int(CurlOpt.HTTP_VERSION)} 100"):
+        c.setopt_batch([(CurlOpt.TIMEOUT_MS, 1000), (CurlOpt.HTTP_VERSION, 100)])
+
+
+def test_ws_recv_into_error_releases_buffer():
+    c = Curl()
+    buffer = bytearray(16)
+    # not a websocket connection
+    with pytest.raises(CurlError):
+        c.ws_recv_into(buffer)
+    # the traceback must not keep the buffer exported
+    buffer.extend(b"\0")
+
+
+def test_ws_send_error_releases_payload():
+    c = Curl()
+    payload = bytearray(16)
+    # not a websocket connection
+    with pytest.raises(CurlError):
+        c.ws_send(payload)
+    # the traceback must not keep the payload exported
+    payload.extend(b"\0")
+
+
 def test_write_function_memory_leak(server):
     c = Curl()
     for _ in range(10):